@@ -3,11 +3,15 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import statistics
+import time
+from collections import deque
 from typing import TYPE_CHECKING, Any
 
 from noscope.deadline import Deadline, Phase
 from noscope.llm.base import LLMProvider, Message, ToolCall, ToolSchema
+from noscope.llm.compaction import elide_old_tool_results
+from noscope.llm.streaming import EarlyToolCalls, complete_turn
 from noscope.logging.events import EventLog
 from noscope.planning.models import PlanTask
 from noscope.tools.base import ToolContext, tool_summary
@@ -19,6 +23,24 @@ if TYPE_CHECKING:
 
 MAX_AGENT_ITERATIONS = 200
 TIME_STATUS_INTERVAL = 3  # Inject time status every N tool calls
+COMPACT_INTERVAL = 20  # Elide stale tool output every N iterations
+TURN_TIME_SAMPLES = 8  # Recent model turns used to predict the next one
+
+# Virtual tool handled by the agent itself rather than the dispatcher
+MARK_COMPLETE_SCHEMA = ToolSchema(
+    name="mark_task_complete",
+    description="Mark a task as completed. Call this after finishing each task.",
+    parameters={
+        "type": "object",
+        "properties": {
+            "task_id": {
+                "type": "string",
+                "description": "The task ID (e.g., t1, t2)",
+            },
+        },
+        "required": ["task_id"],
+    },
+)
 
 
 class BuildAgent:
@@ -49,16 +71,24 @@ class BuildAgent:
         self.ui = ui
         self.tokens = tokens
         self._tool_call_count = 0
+        self._turn_seconds: deque[float] = deque(maxlen=TURN_TIME_SAMPLES)
 
     async def run(
         self,
         tasks: list[PlanTask],
         system_prompt: str,
+        context: str = "",
     ) -> list[PlanTask]:
-        """Execute assigned tasks. Returns tasks with completion status updated."""
+        """Execute assigned tasks. Returns tasks with completion status updated.
+
+        ``system_prompt`` is cached as-is; agent-specific ``context`` goes in a
+        second system message so agents sharing a prompt share its cache entry.
+        """
         task_map = {t.id: t for t in tasks}
 
-        messages: list[Message] = [Message(role="system", content=system_prompt)]
+        messages: list[Message] = [Message(role="system", content=system_prompt, cache=True)]
+        if context:
+            messages.append(Message(role="system", content=context))
 
         task_list = "\n".join(
             f"- [{t.id}] {t.title} ({t.kind}, {t.priority}): {t.description}" for t in tasks
@@ -70,32 +100,16 @@ class BuildAgent:
                     f"Execute these tasks. Work through each in order.\n\n"
                     f"{task_list}\n\nStart with task {tasks[0].id if tasks else 'none'}."
                 ),
+                # Fixed for the agent's lifetime; stays cached once the rolling
+                # breakpoint moves past it
+                cache=True,
             )
         )
 
-        tool_schemas = [
-            ToolSchema(name=s["name"], description=s["description"], parameters=s["parameters"])
-            for s in self.dispatcher.to_schemas()
-        ]
-        tool_schemas.append(
-            ToolSchema(
-                name="mark_task_complete",
-                description="Mark a task as completed. Call this after finishing each task.",
-                parameters={
-                    "type": "object",
-                    "properties": {
-                        "task_id": {
-                            "type": "string",
-                            "description": "The task ID (e.g., t1, t2)",
-                        },
-                    },
-                    "required": ["task_id"],
-                },
-            )
-        )
+        tool_schemas = [*self.dispatcher.tool_schemas(), MARK_COMPLETE_SCHEMA]
 
         for _iteration in range(MAX_AGENT_ITERATIONS):
-            if self.deadline.is_expired() or self.deadline.should_transition(Phase.BUILD):
+            if self.deadline.phase_over(Phase.BUILD):
                 break
 
             # Check if all assigned tasks are done (skip check if no tasks assigned)
@@ -108,7 +122,39 @@ class BuildAgent:
                 )
                 break
 
-            response = await self.provider.complete(messages, tools=tool_schemas)
+            # A turn that typically cannot finish in the time left only burns tokens
+            budget = self.deadline.phase_remaining(Phase.BUILD)
+            if self._turn_seconds and budget < statistics.median(self._turn_seconds):
+                self.event_log.emit(
+                    phase=Phase.BUILD.value,
+                    event_type="agent.time_exhausted",
+                    summary=f"Agent {self.agent_id}: {budget:.0f}s left, too little for a turn",
+                    data={"agent_id": self.agent_id, "remaining": budget},
+                )
+                break
+
+            # Messages are only ever appended, so everything sent so far is a
+            # reusable prefix for the next turn
+            messages[-1].cache = True
+            # Leading read-only calls start while the rest of the turn streams in
+            early = EarlyToolCalls(self.dispatcher.is_parallel_safe, self._dispatch_and_wrap)
+            started = time.monotonic()
+            try:
+                # A turn running past the soft phase boundary is let finish;
+                # only the hard timebox cancels it
+                response = await asyncio.wait_for(
+                    complete_turn(self.provider, messages, tool_schemas, early),
+                    timeout=self.deadline.remaining(),
+                )
+            except TimeoutError:
+                self.event_log.emit(
+                    phase=Phase.BUILD.value,
+                    event_type="agent.time_exhausted",
+                    summary=f"Agent {self.agent_id}: deadline expired during a model turn",
+                    data={"agent_id": self.agent_id, "remaining": 0.0},
+                )
+                break
+            self._turn_seconds.append(time.monotonic() - started)
             if self.tokens:
                 self.tokens.add(response.usage)
 
@@ -121,15 +167,15 @@ class BuildAgent:
             )
 
             if response.content:
+                # One bounded copy shared by the log and the UI (which trims further)
+                preview = f"[{self.agent_id}] {response.content[:200]}"
                 self.event_log.emit(
                     phase=Phase.BUILD.value,
                     event_type="llm.response",
-                    summary=f"[{self.agent_id}] {response.content[:200]}",
+                    summary=preview,
                 )
                 if self.ui:
-                    self.ui.llm_thinking(
-                        f"[{self.agent_id}] {response.content[:150]}", self.deadline
-                    )
+                    self.ui.llm_thinking(preview, self.deadline)
 
             if not response.tool_calls:
                 if response.stop_reason == "end_turn":
@@ -137,7 +183,20 @@ class BuildAgent:
                 continue
 
             # Execute tool calls — parallel for file ops, sequential for shell
-            messages.extend(await self._execute_tool_calls(response.tool_calls, task_map))
+            messages.extend(
+                await self._execute_tool_calls(response.tool_calls, task_map, early.tasks)
+            )
+
+            # Bound prompt growth; batching keeps the cached prefix stable in between
+            if (_iteration + 1) % COMPACT_INTERVAL == 0:
+                elided = elide_old_tool_results(messages)
+                if elided:
+                    self.event_log.emit(
+                        phase=Phase.BUILD.value,
+                        event_type="agent.compact",
+                        summary=f"[{self.agent_id}] Elided {elided} old tool results",
+                        data={"agent_id": self.agent_id, "elided": elided},
+                    )
 
             # Inject time status periodically
             self._tool_call_count += len(response.tool_calls)
@@ -157,20 +216,28 @@ class BuildAgent:
         self,
         tool_calls: list[ToolCall],
         task_map: dict[str, PlanTask],
+        started: dict[str, asyncio.Task[Message]] | None = None,
     ) -> list[Message]:
-        """Execute tool calls with file ops in parallel, shell commands sequential."""
-        results: list[Message] = []
+        """Execute tool calls with file ops in parallel, shell commands sequential.
+
+        File operations on different paths run concurrently; those on the same
+        path keep their order. Results come back in call order. Calls already
+        dispatched during streaming (``started``) are awaited rather than run
+        again.
+        """
+        started = started or {}
+        results: dict[str, Message] = {}
 
         # Separate virtual, file, and shell calls
         virtual_calls: list[ToolCall] = []
-        file_calls: list[ToolCall] = []
+        file_chains: dict[str, list[ToolCall]] = {}
         shell_calls: list[ToolCall] = []
 
         for tc in tool_calls:
             if tc.name == "mark_task_complete":
                 virtual_calls.append(tc)
             elif tc.name in ("write_file", "read_file", "list_directory", "create_directory"):
-                file_calls.append(tc)
+                file_chains.setdefault(str(tc.arguments.get("path", "")), []).append(tc)
             else:
                 shell_calls.append(tc)
 
@@ -187,38 +254,31 @@ class BuildAgent:
                 )
                 if self.ui:
                     self.ui.task_complete(task_id, task_map[task_id].title, self.deadline)
-                results.append(
-                    Message(
-                        role="tool",
-                        content=f"Task {task_id} marked as complete.",
-                        tool_call_id=tc.id,
-                    )
+                results[tc.id] = Message(
+                    role="tool",
+                    content=f"Task {task_id} marked as complete.",
+                    tool_call_id=tc.id,
                 )
             else:
-                results.append(
-                    Message(role="tool", content=f"Unknown task ID: {task_id}", tool_call_id=tc.id)
+                results[tc.id] = Message(
+                    role="tool", content=f"Unknown task ID: {task_id}", tool_call_id=tc.id
                 )
 
-        # Execute file operations in parallel
-        if file_calls:
-            file_coros = [self._dispatch_and_wrap(tc) for tc in file_calls]
-            file_results = await asyncio.gather(*file_coros)
-            results.extend(file_results)
+        async def run_chain(chain: list[ToolCall]) -> list[Message]:
+            return [await (started.get(tc.id) or self._dispatch_and_wrap(tc)) for tc in chain]
+
+        # Execute file operations in parallel, one chain per path
+        chains = [*file_chains.values()]
+        for chain, chain_results in zip(
+            chains, await asyncio.gather(*map(run_chain, chains)), strict=True
+        ):
+            results.update(zip((tc.id for tc in chain), chain_results, strict=True))
 
         # Execute shell commands sequentially (they may depend on each other)
-        for tc in shell_calls:
-            if self.ui:
-                self.ui.tool_activity(tc.name, tool_summary(tc.name, tc.arguments), self.deadline)
-            result = await self.dispatcher.dispatch(tc.name, tc.arguments, self.context)
-            results.append(
-                Message(
-                    role="tool",
-                    content=result.display or json.dumps(result.data),
-                    tool_call_id=tc.id,
-                )
-            )
+        shell_results = await run_chain(shell_calls)
+        results.update(zip((tc.id for tc in shell_calls), shell_results, strict=True))
 
-        return results
+        return [results[tc.id] for tc in tool_calls]
 
     async def _dispatch_and_wrap(self, tc: ToolCall) -> Message:
         """Dispatch a tool call and wrap the result as a Message."""
@@ -227,7 +287,7 @@ class BuildAgent:
         result = await self.dispatcher.dispatch(tc.name, tc.arguments, self.context)
         return Message(
             role="tool",
-            content=result.display or json.dumps(result.data),
+            content=result.as_text,
             tool_call_id=tc.id,
         )
 
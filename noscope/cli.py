@@ -5,13 +5,22 @@ from __future__ import annotations
 import asyncio
 import shutil
 import sys
+from collections.abc import Coroutine
 from pathlib import Path
+from typing import Any
 
 import typer
 from rich.console import Console
 
 from noscope import __version__
 
+try:
+    import uvloop
+
+    HAS_UVLOOP = True
+except ImportError:
+    HAS_UVLOOP = False
+
 app = typer.Typer(
     name="noscope",
     help="Time-boxed autonomous agent orchestration tool",
@@ -20,6 +29,15 @@ app = typer.Typer(
 console = Console()
 
 
+def _run_async(main: Coroutine[Any, Any, Any]) -> None:
+    """Run a top-level coroutine, on uvloop when it is installed (the ``fast`` extra)."""
+    if HAS_UVLOOP:
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+            runner.run(main)
+    else:
+        asyncio.run(main)
+
+
 @app.command()
 def run(
     spec: Path = typer.Option(..., "--spec", "-s", help="Path to spec file"),
@@ -35,6 +53,9 @@ def run(
         False, "--yes", "-y", help="Auto-approve all capability requests"
     ),
     tui: bool = typer.Option(False, "--tui", help="Use full TUI interface"),
+    no_cache: bool = typer.Option(
+        False, "--no-cache", help="Ignore cached PLAN and HANDOFF responses"
+    ),
 ) -> None:
     """Build an MVP from a spec within a timebox."""
     from noscope.config.settings import load_settings
@@ -50,6 +71,7 @@ def run(
             default_provider=provider,
             default_model=model,
             danger_mode=danger,
+            llm_cache=False if no_cache else None,
         )
     except ValueError as e:
         console.print(f"[red]Configuration error:[/red] {e}")
@@ -60,7 +82,7 @@ def run(
     from noscope.orchestrator import Orchestrator
 
     orchestrator = Orchestrator(settings, console=console)
-    asyncio.run(
+    _run_async(
         orchestrator.run(
             spec_path=spec,
             timebox=time,
@@ -239,7 +261,7 @@ acceptance:
     from noscope.orchestrator import Orchestrator
 
     orchestrator = Orchestrator(settings, console=console)
-    asyncio.run(
+    _run_async(
         orchestrator.run(
             spec_input=spec,
             timebox=timebox,
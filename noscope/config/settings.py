@@ -20,6 +20,8 @@ class NoscopeSettings(BaseSettings):
     default_model: str | None = None
     default_timebox: str = "30m"
     danger_mode: bool = False
+    # Reuse PLAN and HANDOFF responses from .noscope/llm_cache on identical prompts
+    llm_cache: bool = True
 
     @model_validator(mode="after")
     def check_api_keys(self) -> NoscopeSettings:
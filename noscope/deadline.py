@@ -81,10 +81,23 @@ class Deadline:
         deadline = self._phase_deadlines.get(phase, self._deadline)
         return max(0.0, deadline - time.monotonic())
 
+    def phase_share(self, phase: Phase) -> float:
+        """Seconds of the timebox allocated to ``phase``."""
+        return self.total_seconds * self.allocation.get(phase, 0.0)
+
     def is_expired(self) -> bool:
         """True if the global deadline has passed."""
         return time.monotonic() >= self._deadline
 
+    def phase_over(self, phase: Phase | None = None) -> bool:
+        """True once the global deadline or the phase's budget has passed.
+
+        Reads the clock once, so both limits are judged at the same instant.
+        """
+        phase = phase or self._current_phase
+        now = time.monotonic()
+        return now >= min(self._deadline, self._phase_deadlines.get(phase, self._deadline))
+
     def is_panic_mode(self) -> bool:
         """True if remaining time < max(60s, 10% of total)."""
         threshold = max(60.0, self.total_seconds * 0.10)
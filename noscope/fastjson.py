@@ -0,0 +1,37 @@
+"""JSON encoding for hot paths, using orjson when it is installed."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def dumps(obj: Any) -> str:
+    """Serialize ``obj`` to compact UTF-8 JSON.
+
+    The output is equivalent with or without orjson but not always byte-identical:
+    floats may be spelled differently (orjson writes ``1e16``, the stdlib ``1e+16``).
+    """
+    if HAS_ORJSON:
+        try:
+            return orjson.dumps(obj).decode()
+        except TypeError:
+            pass  # non-str keys, >64-bit ints etc.; the stdlib handles or rejects them
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+def dumps_indented(obj: Any) -> bytes:
+    """Serialize ``obj`` to 2-space indented UTF-8 JSON bytes for run artifacts."""
+    if HAS_ORJSON:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            pass
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode()
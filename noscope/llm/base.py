@@ -2,12 +2,12 @@
 
 from __future__ import annotations
 
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Callable
 from dataclasses import dataclass, field
 from typing import Any, Literal, Protocol, runtime_checkable
 
 
-@dataclass
+@dataclass(slots=True)
 class Message:
     """A chat message."""
 
@@ -15,9 +15,12 @@ class Message:
     content: str = ""
     tool_calls: list[ToolCall] | None = None
     tool_call_id: str | None = None
+    # Prompt-cache breakpoint: everything up to and including this message is
+    # identical across calls. Providers without explicit caching ignore it.
+    cache: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolCall:
     """A tool call from the LLM."""
 
@@ -26,7 +29,7 @@ class ToolCall:
     arguments: dict[str, Any]
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolSchema:
     """Schema for a tool the LLM can call."""
 
@@ -35,7 +38,7 @@ class ToolSchema:
     parameters: dict[str, Any]
 
 
-@dataclass
+@dataclass(slots=True)
 class Usage:
     """Token usage."""
 
@@ -43,7 +46,7 @@ class Usage:
     output_tokens: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMResponse:
     """Response from a non-streaming LLM call."""
 
@@ -53,14 +56,42 @@ class LLMResponse:
     stop_reason: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class StreamChunk:
     """A chunk from a streaming LLM response."""
 
     delta_text: str = ""
-    delta_tool_call: ToolCall | None = None
+    delta_tool_call: ToolCall | None = None  # emitted once its arguments are complete
     usage: Usage | None = None
     is_final: bool = False
+    stop_reason: str = ""
+
+
+class ToolPayloadCache:
+    """Memoizes a provider's wire-format tool list per set of ToolSchema objects.
+
+    Agent loops pass the same (dispatcher-cached) schema objects every turn, so
+    identity is a cheap, exact key. The schemas are kept alive alongside their
+    payload, which stops their ids being reused while the entry exists.
+    """
+
+    def __init__(
+        self,
+        convert: Callable[[list[ToolSchema]], list[dict[str, Any]]],
+        maxsize: int = 8,
+    ) -> None:
+        self._convert = convert
+        self._maxsize = maxsize
+        self._entries: dict[tuple[int, ...], tuple[list[ToolSchema], list[dict[str, Any]]]] = {}
+
+    def get(self, tools: list[ToolSchema]) -> list[dict[str, Any]]:
+        key = tuple(map(id, tools))
+        entry = self._entries.get(key)
+        if entry is None:
+            if len(self._entries) >= self._maxsize:
+                self._entries.clear()
+            entry = self._entries[key] = (list(tools), self._convert(tools))
+        return entry[1]
 
 
 @runtime_checkable
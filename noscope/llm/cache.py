@@ -0,0 +1,128 @@
+"""Disk-backed response cache for deterministic, tool-free LLM calls."""
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import hashlib
+import json
+import os
+import time
+from collections.abc import AsyncIterator, Callable
+from pathlib import Path
+from typing import Any
+
+from noscope.llm.base import LLMProvider, LLMResponse, Message, StreamChunk, ToolCall, ToolSchema
+
+DEFAULT_CACHE_DIR = Path(".noscope/llm_cache")
+# Entries older than this are misses, so a stale answer can't be replayed forever
+DEFAULT_CACHE_TTL = 7 * 24 * 3600
+
+# Stop reasons of a response that ran to its natural end (Anthropic, OpenAI)
+_COMPLETE_STOP_REASONS = frozenset({"end_turn", "stop_sequence", "stop"})
+
+
+class CachedProvider:
+    """Wraps a provider so identical complete() calls are answered from disk.
+
+    The key covers everything that shapes the response: ``namespace`` (the
+    provider and model), the messages, tools, model override and JSON schema.
+    Hits report zero token usage since nothing was sent. Only use this for
+    calls whose prompt fully determines the wanted answer — never for agent
+    loops whose tool calls depend on live workspace state. stream() is passed
+    through uncached.
+
+    Only responses that ran to a normal stop and pass ``validate`` (when given)
+    are written, so a truncated or unusable answer is retried on the next run
+    rather than replayed. Entries older than ``ttl`` seconds are ignored.
+    """
+
+    def __init__(
+        self,
+        provider: LLMProvider,
+        namespace: str,
+        cache_dir: Path = DEFAULT_CACHE_DIR,
+        ttl: float = DEFAULT_CACHE_TTL,
+        validate: Callable[[LLMResponse], bool] | None = None,
+    ) -> None:
+        self._provider = provider
+        self._namespace = namespace
+        self._cache_dir = cache_dir
+        self._ttl = ttl
+        self._validate = validate
+
+    def cache_key(
+        self,
+        messages: list[Message],
+        tools: list[ToolSchema] | None = None,
+        model: str | None = None,
+        json_schema: dict[str, Any] | None = None,
+    ) -> str:
+        payload = {
+            "namespace": self._namespace,
+            "messages": [dataclasses.asdict(m) for m in messages],
+            "tools": [dataclasses.asdict(t) for t in tools or []],
+            "model": model,
+            "json_schema": json_schema,
+        }
+        encoded = json.dumps(payload, sort_keys=True, default=str).encode()
+        return hashlib.sha256(encoded).hexdigest()
+
+    async def complete(
+        self,
+        messages: list[Message],
+        tools: list[ToolSchema] | None = None,
+        model: str | None = None,
+        json_schema: dict[str, Any] | None = None,
+    ) -> LLMResponse:
+        path = self._cache_dir / f"{self.cache_key(messages, tools, model, json_schema)}.json"
+        cached = await asyncio.to_thread(_read_response, path, self._ttl)
+        if cached is not None:
+            return cached
+
+        response = await self._provider.complete(
+            messages, tools=tools, model=model, json_schema=json_schema
+        )
+        if response.stop_reason in _COMPLETE_STOP_REASONS and (
+            self._validate is None or self._validate(response)
+        ):
+            await asyncio.to_thread(_write_response, path, response)
+        return response
+
+    def stream(
+        self,
+        messages: list[Message],
+        tools: list[ToolSchema] | None = None,
+        model: str | None = None,
+    ) -> AsyncIterator[StreamChunk]:
+        return self._provider.stream(messages, tools=tools, model=model)
+
+
+def _read_response(path: Path, ttl: float) -> LLMResponse | None:
+    try:
+        if time.time() - path.stat().st_mtime > ttl:
+            return None
+        data = json.loads(path.read_text(encoding="utf-8"))
+        return LLMResponse(
+            content=data["content"],
+            tool_calls=[ToolCall(**tc) for tc in data["tool_calls"]],
+            stop_reason=data["stop_reason"],
+        )
+    except (OSError, ValueError, KeyError, TypeError):
+        # Missing or unreadable entries are just misses
+        return None
+
+
+def _write_response(path: Path, response: LLMResponse) -> None:
+    data = {
+        "content": response.content,
+        "tool_calls": [dataclasses.asdict(tc) for tc in response.tool_calls],
+        "stop_reason": response.stop_reason,
+    }
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(data), encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError:
+        pass  # A cache that can't be written is still a correct (uncached) call
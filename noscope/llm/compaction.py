@@ -0,0 +1,33 @@
+"""Shrink conversation history that no longer earns its prompt tokens."""
+
+from __future__ import annotations
+
+from noscope.llm.base import Message
+
+KEEP_RECENT_TURNS = 5
+ELIDE_MIN_CHARS = 512
+
+
+def elide_old_tool_results(
+    messages: list[Message],
+    keep_turns: int = KEEP_RECENT_TURNS,
+    min_chars: int = ELIDE_MIN_CHARS,
+) -> int:
+    """Replace large tool results from before the last ``keep_turns`` turns with a stub.
+
+    The stub keeps the first line (usually the command or error) so the model
+    still knows what happened. Stubs are short, so each message is rewritten at
+    most once. Returns the number of messages elided.
+    """
+    turn_starts = [i for i, msg in enumerate(messages) if msg.role == "assistant"]
+    if len(turn_starts) <= keep_turns:
+        return 0
+
+    elided = 0
+    for msg in messages[: turn_starts[-keep_turns]]:
+        if msg.role != "tool" or len(msg.content) <= min_chars:
+            continue
+        first_line = msg.content.split("\n", 1)[0][:80]
+        msg.content = f"[elided {len(msg.content)} chars; first line: {first_line}]"
+        elided += 1
+    return elided
@@ -13,19 +13,28 @@ from noscope.llm.base import (
     Message,
     StreamChunk,
     ToolCall,
+    ToolPayloadCache,
     ToolSchema,
     Usage,
 )
 
 DEFAULT_MODEL = "claude-sonnet-4-20250514"
 
+# The API rejects requests with more than four cache_control blocks
+MAX_CACHE_BREAKPOINTS = 4
+_EPHEMERAL = {"type": "ephemeral"}
+
 
 class AnthropicProvider:
     """LLM provider using the Anthropic SDK."""
 
+    # stream() yields each tool call as soon as its input block closes
+    streams_tool_calls = True
+
     def __init__(self, api_key: str, model: str | None = None) -> None:
         self._client = anthropic.AsyncAnthropic(api_key=api_key)
         self._default_model = model or DEFAULT_MODEL
+        self._tools = ToolPayloadCache(_convert_tools)
 
     async def complete(
         self,
@@ -45,7 +54,7 @@ class AnthropicProvider:
         if system_msg:
             kwargs["system"] = system_msg
         if tools:
-            kwargs["tools"] = _convert_tools(tools)
+            kwargs["tools"] = self._tools.get(tools)
 
         # Retry on rate limits with exponential backoff
         max_retries = 4
@@ -100,37 +109,78 @@ class AnthropicProvider:
         if system_msg:
             kwargs["system"] = system_msg
         if tools:
-            kwargs["tools"] = _convert_tools(tools)
-
-        async with self._client.messages.stream(**kwargs) as stream:
-            async for event in stream:
-                if hasattr(event, "type"):
-                    if event.type == "content_block_delta":
-                        if hasattr(event.delta, "text"):
-                            yield StreamChunk(delta_text=event.delta.text)
-                        elif hasattr(event.delta, "partial_json"):
-                            yield StreamChunk(delta_text=event.delta.partial_json)
-                    elif event.type == "message_stop":
-                        final_msg = await stream.get_final_message()
-                        yield StreamChunk(
-                            is_final=True,
-                            usage=Usage(
-                                input_tokens=final_msg.usage.input_tokens,
-                                output_tokens=final_msg.usage.output_tokens,
-                            ),
-                        )
-
-
-def _split_messages(messages: list[Message]) -> tuple[str, list[dict[str, Any]]]:
-    """Split system message from conversation messages for Anthropic API."""
-    system = ""
+            kwargs["tools"] = self._tools.get(tools)
+
+        # Rate limits surface when the stream opens, before anything is yielded
+        max_retries = 4
+        for attempt in range(max_retries + 1):
+            try:
+                async with self._client.messages.stream(**kwargs) as stream:
+                    async for event in stream:
+                        if event.type == "content_block_delta":
+                            if event.delta.type == "text_delta":
+                                yield StreamChunk(delta_text=event.delta.text)
+                        elif event.type == "content_block_stop":
+                            block = event.content_block
+                            if block.type == "tool_use":
+                                yield StreamChunk(
+                                    delta_tool_call=ToolCall(
+                                        id=block.id,
+                                        name=block.name,
+                                        arguments=block.input
+                                        if isinstance(block.input, dict)
+                                        else {},
+                                    )
+                                )
+                        elif event.type == "message_stop":
+                            final_msg = await stream.get_final_message()
+                            yield StreamChunk(
+                                is_final=True,
+                                usage=Usage(
+                                    input_tokens=final_msg.usage.input_tokens,
+                                    output_tokens=final_msg.usage.output_tokens,
+                                ),
+                                stop_reason=final_msg.stop_reason or "",
+                            )
+                return
+            except anthropic.RateLimitError:
+                if attempt >= max_retries:
+                    raise
+                await asyncio.sleep(2**attempt)
+
+
+def _split_messages(
+    messages: list[Message],
+) -> tuple[str | list[dict[str, Any]], list[dict[str, Any]]]:
+    """Split system message from conversation messages for Anthropic API.
+
+    Messages flagged with ``cache`` get a ``cache_control`` breakpoint on their
+    last content block; a cached system prompt is sent as a list of text blocks.
+    Past the API limit, the leading breakpoints (static prompts) and the newest
+    one (the rolling conversation tail) are kept.
+    """
+    flagged = [i for i, msg in enumerate(messages) if msg.cache]
+    if len(flagged) > MAX_CACHE_BREAKPOINTS:
+        flagged = flagged[: MAX_CACHE_BREAKPOINTS - 1] + flagged[-1:]
+    breakpoints = set(flagged)
+
+    system_blocks: list[dict[str, Any]] = []
+    system_cached = False
     api_messages: list[dict[str, Any]] = []
 
-    for msg in messages:
+    for i, msg in enumerate(messages):
+        cache = i in breakpoints
+
         if msg.role == "system":
-            system += msg.content + "\n"
-        elif msg.role == "assistant":
-            content: list[dict[str, Any]] = []
+            block: dict[str, Any] = {"type": "text", "text": msg.content}
+            if cache:
+                block["cache_control"] = _EPHEMERAL
+                system_cached = True
+            system_blocks.append(block)
+            continue
+
+        content: list[dict[str, Any]] = []
+        if msg.role == "assistant":
             if msg.content:
                 content.append({"type": "text", "text": msg.content})
             if msg.tool_calls:
@@ -143,24 +193,30 @@ def _split_messages(messages: list[Message]) -> tuple[str, list[dict[str, Any]]]
                             "input": tc.arguments,
                         }
                     )
-            api_messages.append({"role": "assistant", "content": content or msg.content})
+            role = "assistant"
         elif msg.role == "tool":
-            api_messages.append(
+            content.append(
                 {
-                    "role": "user",
-                    "content": [
-                        {
-                            "type": "tool_result",
-                            "tool_use_id": msg.tool_call_id,
-                            "content": msg.content,
-                        }
-                    ],
+                    "type": "tool_result",
+                    "tool_use_id": msg.tool_call_id,
+                    "content": msg.content,
                 }
             )
+            role = "user"
+        elif cache:
+            content.append({"type": "text", "text": msg.content})
+            role = msg.role
         else:
             api_messages.append({"role": msg.role, "content": msg.content})
+            continue
+
+        if cache and content:
+            content[-1]["cache_control"] = _EPHEMERAL
+        api_messages.append({"role": role, "content": content or msg.content})
 
-    return system.strip(), api_messages
+    if system_cached:
+        return system_blocks, api_messages
+    return "\n".join(b["text"] for b in system_blocks).strip(), api_messages
 
 
 def _convert_tools(tools: list[ToolSchema]) -> list[dict[str, Any]]:
@@ -4,15 +4,18 @@ from __future__ import annotations
 
 import json
 from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
 from typing import Any
 
 import openai
 
+from noscope import fastjson
 from noscope.llm.base import (
     LLMResponse,
     Message,
     StreamChunk,
     ToolCall,
+    ToolPayloadCache,
     ToolSchema,
     Usage,
 )
@@ -23,9 +26,13 @@ DEFAULT_MODEL = "gpt-4o"
 class OpenAIProvider:
     """LLM provider using the OpenAI SDK."""
 
+    # stream() yields each tool call as soon as its arguments are complete
+    streams_tool_calls = True
+
     def __init__(self, api_key: str, model: str | None = None) -> None:
         self._client = openai.AsyncOpenAI(api_key=api_key)
         self._default_model = model or DEFAULT_MODEL
+        self._tools = ToolPayloadCache(_convert_tools)
 
     async def complete(
         self,
@@ -42,7 +49,7 @@ class OpenAIProvider:
             "messages": api_messages,
         }
         if tools:
-            kwargs["tools"] = _convert_tools(tools)
+            kwargs["tools"] = self._tools.get(tools)
         if json_schema:
             kwargs["response_format"] = {"type": "json_object"}
 
@@ -89,7 +96,11 @@ class OpenAIProvider:
             "stream_options": {"include_usage": True},
         }
         if tools:
-            kwargs["tools"] = _convert_tools(tools)
+            kwargs["tools"] = self._tools.get(tools)
+
+        # Tool calls stream one after another, so a new index closes the previous call
+        current: _PartialToolCall | None = None
+        stop_reason = ""
 
         stream = await self._client.chat.completions.create(**kwargs)
         async for chunk in stream:
@@ -102,13 +113,50 @@ class OpenAIProvider:
                             input_tokens=chunk.usage.prompt_tokens,
                             output_tokens=chunk.usage.completion_tokens,
                         ),
+                        stop_reason=stop_reason,
                     )
                 continue
 
-            delta = chunk.choices[0].delta
+            choice = chunk.choices[0]
+            delta = choice.delta
             if delta.content:
                 yield StreamChunk(delta_text=delta.content)
 
+            for tc_delta in delta.tool_calls or []:
+                if current is None or tc_delta.index != current.index:
+                    if current is not None:
+                        yield StreamChunk(delta_tool_call=current.finish())
+                    current = _PartialToolCall(index=tc_delta.index)
+                if tc_delta.id:
+                    current.id = tc_delta.id
+                if tc_delta.function and tc_delta.function.name:
+                    current.name = tc_delta.function.name
+                if tc_delta.function and tc_delta.function.arguments:
+                    current.arguments.append(tc_delta.function.arguments)
+
+            if choice.finish_reason:
+                stop_reason = choice.finish_reason
+                if current is not None:
+                    yield StreamChunk(delta_tool_call=current.finish())
+                    current = None
+
+
+@dataclass
+class _PartialToolCall:
+    """A tool call whose argument JSON is still streaming in."""
+
+    index: int
+    id: str = ""
+    name: str = ""
+    arguments: list[str] = field(default_factory=list)
+
+    def finish(self) -> ToolCall:
+        try:
+            arguments = json.loads("".join(self.arguments) or "{}")
+        except json.JSONDecodeError:
+            arguments = {}
+        return ToolCall(id=self.id, name=self.name, arguments=arguments)
+
 
 def _convert_messages(messages: list[Message]) -> list[dict[str, Any]]:
     """Convert messages to OpenAI format."""
@@ -122,7 +170,8 @@ def _convert_messages(messages: list[Message]) -> list[dict[str, Any]]:
                     "type": "function",
                     "function": {
                         "name": tc.name,
-                        "arguments": json.dumps(tc.arguments),
+                        # Re-encoded for every past call on every turn
+                        "arguments": fastjson.dumps(tc.arguments),
                     },
                 }
                 for tc in msg.tool_calls
@@ -0,0 +1,95 @@
+"""Assemble streamed completions, handing out tool calls as soon as they finish."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from noscope.llm.base import LLMProvider, LLMResponse, Message, ToolCall, ToolSchema, Usage
+
+
+class EarlyToolCalls:
+    """Starts the leading run of parallel-safe tool calls while a turn is still streaming.
+
+    Once a call that may have side effects arrives, nothing after it is started
+    early, so execution order is the same as dispatching after the turn ends.
+    """
+
+    def __init__(
+        self,
+        is_parallel_safe: Callable[[str], bool],
+        start: Callable[[ToolCall], Awaitable[Any]],
+    ) -> None:
+        self._is_parallel_safe = is_parallel_safe
+        self._start = start
+        self._barrier = False
+        self.tasks: dict[str, asyncio.Task[Any]] = {}
+
+    def __call__(self, tc: ToolCall) -> None:
+        if self._barrier or not self._is_parallel_safe(tc.name):
+            self._barrier = True
+            return
+        self.tasks[tc.id] = asyncio.ensure_future(self._start(tc))
+
+    def cancel(self) -> None:
+        for task in self.tasks.values():
+            task.cancel()
+
+
+def streams_tool_calls(provider: LLMProvider) -> bool:
+    """True if the provider's stream() emits complete tool calls before the turn ends."""
+    return bool(getattr(provider, "streams_tool_calls", False))
+
+
+async def complete_turn(
+    provider: LLMProvider,
+    messages: list[Message],
+    tools: list[ToolSchema] | None = None,
+    early: EarlyToolCalls | None = None,
+) -> LLMResponse:
+    """One agent-loop LLM call: streamed when the provider supports it, else complete()."""
+    if not streams_tool_calls(provider):
+        return await provider.complete(messages, tools=tools)
+    try:
+        return await stream_complete(provider, messages, tools, on_tool_call=early)
+    except BaseException:
+        if early:
+            early.cancel()
+        raise
+
+
+async def stream_complete(
+    provider: LLMProvider,
+    messages: list[Message],
+    tools: list[ToolSchema] | None = None,
+    on_tool_call: Callable[[ToolCall], None] | None = None,
+) -> LLMResponse:
+    """Run a streamed completion and return the same LLMResponse complete() would.
+
+    ``on_tool_call`` is invoked for each tool call the moment it is complete,
+    while the model may still be generating the rest of the turn.
+    """
+    content: list[str] = []
+    tool_calls: list[ToolCall] = []
+    usage = Usage()
+    stop_reason = ""
+
+    async for chunk in provider.stream(messages, tools=tools):
+        if chunk.delta_text:
+            content.append(chunk.delta_text)
+        if chunk.delta_tool_call:
+            tool_calls.append(chunk.delta_tool_call)
+            if on_tool_call:
+                on_tool_call(chunk.delta_tool_call)
+        if chunk.usage:
+            usage = chunk.usage
+        if chunk.stop_reason:
+            stop_reason = chunk.stop_reason
+
+    return LLMResponse(
+        content="".join(content),
+        tool_calls=tool_calls,
+        usage=usage,
+        stop_reason=stop_reason,
+    )
@@ -2,8 +2,15 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import functools
 import json
+import logging
+import os
+from dataclasses import dataclass
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
 from rich.console import Console
@@ -12,6 +19,8 @@ from noscope.capabilities import CapabilityStore
 from noscope.config.settings import NoscopeSettings
 from noscope.deadline import Deadline, Phase
 from noscope.llm import create_provider
+from noscope.llm.base import LLMProvider
+from noscope.llm.cache import CachedProvider
 from noscope.logging.events import EventLog, RunDir
 from noscope.phases import (
     HandoffPhase,
@@ -22,11 +31,12 @@ from noscope.phases import (
     VerifyPhase,
 )
 from noscope.planning.models import PlanOutput
+from noscope.planning.planner import is_valid_plan
 from noscope.spec.contract import generate_contract
 from noscope.spec.models import SpecInput
 from noscope.spec.parser import parse_spec
 from noscope.supervisor import Supervisor
-from noscope.tools.base import ToolContext
+from noscope.tools.base import Tool, ToolContext
 from noscope.tools.dispatcher import ToolDispatcher
 from noscope.tools.docker import (
     DockerCreateDirectoryTool,
@@ -35,6 +45,7 @@ from noscope.tools.docker import (
     DockerSandbox,
     DockerShellTool,
     DockerWriteFileTool,
+    pull_image,
 )
 from noscope.tools.filesystem import (
     CreateDirectoryTool,
@@ -50,7 +61,15 @@ from noscope.tools.git import (
     GitStatusTool,
 )
 from noscope.tools.shell import ShellTool, build_execution_env
-from noscope.ui.console import ConsoleUI
+from noscope.ui.console import ConsoleUI, ask_user
+
+logger = logging.getLogger(__name__)
+
+# Sibling directories holding a cleared workspace until it is deleted
+_TRASH_PREFIX = ".noscope-trash-"
+
+# The event log is an after-the-fact record, so a short write-behind is fine
+EVENT_FLUSH_INTERVAL = 0.1
 
 
 class Orchestrator:
@@ -59,22 +78,30 @@ class Orchestrator:
     def __init__(self, settings: NoscopeSettings, console: Console | None = None) -> None:
         self.settings = settings
         self.provider = create_provider(settings)
+        self._provider_name = settings.default_provider or "anthropic"
         self.ui = ConsoleUI(console)
         self._model = settings.default_model or self._default_model_for_provider()
+        # Read-only so concurrent runs sharing this orchestrator can't mutate it
+        self._secrets = MappingProxyType(_runtime_secrets(settings))
+
+    def _cache_namespace(self) -> str:
+        return f"{self._provider_name}:{self._model}"
 
     def _default_model_for_provider(self) -> str:
-        if self.settings.default_provider == "openai":
+        if self._provider_name == "openai":
             return "gpt-4o"
         return "claude-sonnet-4-20250514"
 
-    def _handle_dirty_workspace(self, workspace: Path) -> Path:
+    async def _handle_dirty_workspace(self, workspace: Path) -> Path:
         """Prompt user when workspace is non-empty. Returns the workspace to use."""
         from rich.prompt import Prompt
 
         self.ui.console.print(
             f"\n  [yellow]Warning:[/yellow] Workspace already contains files: {workspace}"
         )
-        choice = Prompt.ask(
+        # Blocking input() runs off the loop so background work (image pull) keeps going
+        choice = await ask_user(
+            Prompt.ask,
             "  [bold]Clear it, use a new directory, or abort?[/bold]",
             choices=["clear", "new", "abort"],
             default="clear",
@@ -127,8 +154,19 @@ class Orchestrator:
         workspace = workspace.resolve()
         workspace.mkdir(parents=True, exist_ok=True)
 
+        # Pull the sandbox image while the user decides what to do with the workspace
+        image_ready = asyncio.create_task(pull_image()) if sandbox else None
+
         if _workspace_has_files(workspace) and not auto_approve:
-            workspace = self._handle_dirty_workspace(workspace)
+            try:
+                workspace = await self._handle_dirty_workspace(workspace)
+            except BaseException:
+                # Aborted or interrupted: don't leave a docker pull running behind us
+                if image_ready:
+                    image_ready.cancel()
+                    with contextlib.suppress(asyncio.CancelledError):
+                        await image_ready
+                raise
         elif _workspace_has_files(workspace) and auto_approve:
             # With --yes, auto-clear and start fresh
             _clear_workspace(workspace)
@@ -136,7 +174,7 @@ class Orchestrator:
 
         # 3. Set up run directory and event log
         run_dir = RunDir()
-        event_log = EventLog(run_dir)
+        event_log = EventLog(run_dir, flush_interval=EVENT_FLUSH_INTERVAL)
 
         event_log.emit(
             phase="INIT",
@@ -159,6 +197,8 @@ class Orchestrator:
 
         if sandbox:
             docker_sandbox = DockerSandbox(workspace)
+            if image_ready:
+                await image_ready
             await docker_sandbox.ensure_running()
             self.ui.console.print(
                 "  [cyan]Docker sandbox active[/cyan] — all operations run in isolated container"
@@ -178,20 +218,17 @@ class Orchestrator:
                 ]
             )
         else:
-            dispatcher.register_all(
-                [
-                    ReadFileTool(),
-                    WriteFileTool(),
-                    ListDirectoryTool(),
-                    CreateDirectoryTool(),
-                    ShellTool(),
-                    GitInitTool(),
-                    GitStatusTool(),
-                    GitAddTool(),
-                    GitCommitTool(),
-                    GitDiffTool(),
-                ]
-            )
+            dispatcher.register_all(list(_local_tools()))
+
+        # For the single-shot calls (PLAN, HANDOFF) the prompt fully determines
+        # the wanted answer, so reruns on identical inputs reuse it from disk
+        # instead of making a fresh LLM call. Only plans that validate are kept.
+        plan_provider: LLMProvider = self.provider
+        handoff_provider: LLMProvider = self.provider
+        if self.settings.llm_cache:
+            namespace = self._cache_namespace()
+            plan_provider = CachedProvider(self.provider, namespace, validate=is_valid_plan)
+            handoff_provider = CachedProvider(self.provider, namespace)
 
         tasks: list[Any] = []
         acceptance_results: list[dict[str, Any]] = []
@@ -205,16 +242,16 @@ class Orchestrator:
             )
             plan_phase = PlanPhase()
             plan_output = await plan_phase.run(
-                spec, self.provider, event_log, deadline, tokens=tokens
+                spec, plan_provider, event_log, deadline, tokens=tokens
             )
             self.ui.console.print(
                 f"  Plan: [cyan]{len(plan_output.tasks)}[/cyan] tasks, "
                 f"[cyan]{len(plan_output.requested_capabilities)}[/cyan] capabilities requested"
             )
 
-            # Save plan
-            run_dir.plan_path.write_text(
-                json.dumps(plan_output.model_dump(), indent=2), encoding="utf-8"
+            # Save plan off the event loop while REQUEST waits on the user
+            plan_written = asyncio.create_task(
+                _write_text(run_dir.plan_path, json.dumps(plan_output.model_dump(), indent=2))
             )
 
             # 6. REQUEST phase — danger mode auto-approves everything
@@ -224,21 +261,29 @@ class Orchestrator:
             )
             if not should_auto:
                 self.ui.capability_table(plan_output.requested_capabilities)
-            request_phase = RequestPhase()
-            grants = await request_phase.run(
-                plan_output, event_log, deadline, auto_approve=should_auto
-            )
+            request_phase = RequestPhase(console=self.ui.console)
+            try:
+                grants = await request_phase.run(
+                    plan_output, event_log, deadline, auto_approve=should_auto
+                )
+            finally:
+                # Awaited even when REQUEST fails, so the plan lands and any
+                # write error surfaces instead of going unretrieved
+                await plan_written
             approved = sum(1 for g in grants if g.approved)
             self.ui.console.print(f"  Approved [cyan]{approved}/{len(grants)}[/cyan] capabilities")
 
-            # Save grants
-            run_dir.capabilities_grant_path.write_text(
-                json.dumps([g.model_dump() for g in grants], indent=2), encoding="utf-8"
-            )
-
-            # 7. Write contract
+            # Save grants and write the contract (7) concurrently
             cap_store = CapabilityStore(grants)
-            generate_contract(spec, plan_output, grants, run_dir.contract_path)
+            await asyncio.gather(
+                _write_text(
+                    run_dir.capabilities_grant_path,
+                    json.dumps([g.model_dump() for g in grants], indent=2),
+                ),
+                asyncio.to_thread(
+                    generate_contract, spec, plan_output, grants, run_dir.contract_path
+                ),
+            )
 
             # 8. BUILD phase
             self.ui.phase_banner(Phase.BUILD, "Building MVP...", deadline.format_remaining())
@@ -247,7 +292,7 @@ class Orchestrator:
                 capabilities=cap_store,
                 event_log=event_log,
                 deadline=deadline,
-                secrets=_runtime_secrets(self.settings),
+                secrets=self._secrets,
                 danger_mode=self.settings.danger_mode,
             )
 
@@ -319,7 +364,7 @@ class Orchestrator:
                 plan_output or _empty_plan(),
                 tasks,
                 acceptance_results,
-                self.provider,
+                handoff_provider,
                 event_log,
                 deadline,
                 run_dir.handoff_path,
@@ -334,9 +379,9 @@ class Orchestrator:
                 summary=f"Handoff report generation failed: {e}",
                 data={"error": str(e), "type": type(e).__name__},
             )
-            run_dir.handoff_path.write_text(
+            await _write_text(
+                run_dir.handoff_path,
                 f"# Handoff Report: {spec.name}\n\nRun failed with error: {e}\n",
-                encoding="utf-8",
             )
 
         # Stop Docker sandbox and sync files back to host
@@ -349,6 +394,7 @@ class Orchestrator:
             except Exception as e:
                 self.ui.console.print(f"  [red]Docker sync failed:[/red] {e}")
 
+        stats = _summarize(tasks, acceptance_results)
         event_log.emit(
             phase="DONE",
             event_type="run.complete",
@@ -357,6 +403,10 @@ class Orchestrator:
                 "run_dir": str(run_dir.path),
                 "input_tokens": tokens.input_tokens,
                 "output_tokens": tokens.output_tokens,
+                "tasks_completed": stats.tasks_completed,
+                "tasks_total": stats.tasks_total,
+                "checks_passed": stats.checks_passed,
+                "checks_total": stats.checks_total,
             },
         )
         event_log.close()
@@ -364,28 +414,24 @@ class Orchestrator:
         # Detect launch info
         verified_ok = verify_data[0] if verify_data else None
         verify_msg = verify_data[1] if verify_data else ""
-        launch_cmd, launch_url = _detect_launch(workspace)
-
-        completed_count = sum(1 for t in tasks if t.completed) if tasks else 0
-        checks_passed = sum(1 for r in acceptance_results if r.get("passed"))
+        launch_cmd, launch_url = await _detect_launch(workspace)
 
         # Show final summary — ALWAYS
-        provider_name = self.settings.default_provider or "anthropic"
         self.ui.final_summary(
             spec_name=spec.name,
             timebox=spec.timebox,
             workspace=workspace,
             run_dir=run_dir.path,
-            tasks_completed=completed_count,
-            tasks_total=len(tasks),
-            checks_passed=checks_passed,
-            checks_total=len(acceptance_results),
+            tasks_completed=stats.tasks_completed,
+            tasks_total=stats.tasks_total,
+            checks_passed=stats.checks_passed,
+            checks_total=stats.checks_total,
             verified=verified_ok,
             verify_msg=verify_msg,
             launch_url=launch_url if launch_cmd else None,
             input_tokens=tokens.input_tokens,
             output_tokens=tokens.output_tokens,
-            provider=provider_name,
+            provider=self._provider_name,
             model=self._model,
         )
 
@@ -397,38 +443,94 @@ class Orchestrator:
         return run_dir.path
 
 
-def _detect_launch(workspace: Path) -> tuple[str | None, str]:
+@dataclass
+class RunStats:
+    """Task and acceptance-check tallies for the end of a run."""
+
+    tasks_completed: int
+    tasks_total: int
+    checks_passed: int
+    checks_total: int
+
+
+def _summarize(tasks: list[Any], acceptance_results: list[dict[str, Any]]) -> RunStats:
+    """Tally completed tasks and passed checks once for the DONE event and summary."""
+    return RunStats(
+        tasks_completed=sum(1 for t in tasks if t.completed),
+        tasks_total=len(tasks),
+        checks_passed=sum(1 for r in acceptance_results if r.get("passed")),
+        checks_total=len(acceptance_results),
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _local_tools() -> tuple[Tool, ...]:
+    """Host-side tools, built once per process — they hold no per-run state."""
+    return (
+        ReadFileTool(),
+        WriteFileTool(),
+        ListDirectoryTool(),
+        CreateDirectoryTool(),
+        ShellTool(),
+        GitInitTool(),
+        GitStatusTool(),
+        GitAddTool(),
+        GitCommitTool(),
+        GitDiffTool(),
+    )
+
+
+async def _detect_launch(workspace: Path) -> tuple[str | None, str]:
     """Detect how to launch the built app. Returns (command, url)."""
-    # Python/Flask
-    app_py = workspace / "app.py"
-    main_py = workspace / "main.py"
-    manage_py = workspace / "manage.py"
-    package_json = workspace / "package.json"
+    # Probe all candidates at once, off the event loop
+    app_content, main_content, has_manage_py, has_package_json = await asyncio.gather(
+        asyncio.to_thread(_read_ends, workspace / "app.py"),
+        asyncio.to_thread(_read_ends, workspace / "main.py"),
+        asyncio.to_thread((workspace / "manage.py").exists),
+        asyncio.to_thread((workspace / "package.json").exists),
+    )
 
-    if app_py.exists():
+    # Python/Flask
+    if app_content is not None:
         # Check if it's Flask/FastAPI
-        content = app_py.read_text(encoding="utf-8", errors="replace")
-        if "flask" in content.lower() or "Flask" in content:
+        if "flask" in app_content.lower() or "Flask" in app_content:
             return "python3 app.py", "http://localhost:5000"
-        if "fastapi" in content.lower() or "FastAPI" in content:
+        if "fastapi" in app_content.lower() or "FastAPI" in app_content:
             return "python3 -m uvicorn app:app --host 0.0.0.0 --port 8000", "http://localhost:8000"
         return "python3 app.py", "http://localhost:5000"
 
-    if main_py.exists():
-        content = main_py.read_text(encoding="utf-8", errors="replace")
-        if "flask" in content.lower() or "fastapi" in content.lower():
+    if main_content is not None:
+        if "flask" in main_content.lower() or "fastapi" in main_content.lower():
             return "python3 main.py", "http://localhost:5000"
         return "python3 main.py", "http://localhost:8000"
 
-    if manage_py.exists():
+    if has_manage_py:
         return "python3 manage.py runserver", "http://localhost:8000"
 
-    if package_json.exists():
+    if has_package_json:
         return "npm start", "http://localhost:3000"
 
     return None, ""
 
 
+def _read_ends(path: Path, size: int = 16384) -> str | None:
+    """Return the first and last ``size`` bytes of a file as text, or None if it doesn't exist.
+
+    Imports sit at the top and ``app.run(...)``-style entry points at the bottom,
+    so both ends carry the framework markers without reading a large file whole.
+    """
+    try:
+        with path.open("rb") as f:
+            data = f.read(size)
+            end = f.seek(0, os.SEEK_END)
+            if end > size:
+                f.seek(max(size, end - size))
+                data += b"\n" + f.read()
+    except (FileNotFoundError, IsADirectoryError):
+        return None
+    return data.decode("utf-8", errors="replace")
+
+
 async def _run_server(command: str, workspace: Path) -> None:
     """Start the server and let the user interact with it. Blocks until Ctrl+C."""
     import asyncio
@@ -466,19 +568,65 @@ def _workspace_has_files(workspace: Path) -> bool:
 
 
 def _clear_workspace(workspace: Path) -> None:
-    """Remove all files from workspace except .noscope and .git."""
+    """Remove all files from workspace except .noscope and .git.
+
+    Entries are renamed into a sibling trash directory and deleted by a
+    background thread, so a large tree (node_modules) doesn't hold up the run.
+    Trash left behind by an earlier run that was killed mid-delete is swept in
+    the same thread. Anything that can't be renamed (Windows, cross-device) is
+    deleted in place.
+    """
     import shutil
+    import sys
+    import threading
+    import uuid
 
     ignore = {".noscope", ".git"}
-    for item in workspace.iterdir():
-        if item.name in ignore:
-            continue
-        if item.is_dir():
+    items = [item for item in workspace.iterdir() if item.name not in ignore]
+    trash_dirs = list(workspace.parent.glob(f"{_TRASH_PREFIX}*"))
+
+    if items and sys.platform != "win32":
+        trash = workspace.parent / f"{_TRASH_PREFIX}{uuid.uuid4().hex}"
+        try:
+            trash.mkdir()
+            for item in items:
+                item.rename(trash / item.name)
+        except OSError:
+            pass
+        if trash.exists():
+            trash_dirs.append(trash)
+
+    if trash_dirs:
+        threading.Thread(
+            target=_delete_trash,
+            args=(trash_dirs,),
+            name="noscope-clear-workspace",
+        ).start()
+
+    for item in items:
+        if not item.exists() and not item.is_symlink():
+            continue  # moved to trash
+        if item.is_dir() and not item.is_symlink():
             shutil.rmtree(item)
         else:
             item.unlink()
 
 
+def _delete_trash(trash_dirs: list[Path]) -> None:
+    """Delete workspace trash directories, warning about any that survive."""
+    import shutil
+
+    for trash in trash_dirs:
+        shutil.rmtree(trash, ignore_errors=True)
+        if trash.exists():
+            logger.warning("Could not fully delete old workspace files in %s", trash)
+
+
+async def _write_text(path: Path, text: str) -> None:
+    """Write a run artifact in a worker thread so the event loop keeps serving awaits."""
+    await asyncio.to_thread(path.write_text, text, encoding="utf-8")
+
+
 def _empty_plan() -> PlanOutput:
     """Return a minimal plan for error fallback."""
     from noscope.planning.models import PlanOutput
@@ -2,33 +2,104 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
+import functools
+import os
+import re
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+from rich.console import Console
+from rich.prompt import Confirm
+
 from noscope.capabilities import (
     CapabilityGrant,
     CapabilityRequest,
 )
 from noscope.deadline import Deadline, Phase
-from noscope.llm.base import LLMProvider, Message, ToolSchema, Usage
+from noscope.llm.base import LLMProvider, Message, ToolCall, Usage
+from noscope.llm.compaction import elide_old_tool_results
+from noscope.llm.streaming import EarlyToolCalls, complete_turn
 from noscope.logging.events import EventLog
 from noscope.planning.models import PlanOutput, PlanTask
 from noscope.planning.planner import plan as generate_plan
 from noscope.spec.models import SpecInput
-from noscope.tools.base import ToolContext, tool_summary
-from noscope.tools.dispatcher import ToolDispatcher
+from noscope.tools.base import ToolContext, ToolResult, tool_summary
+from noscope.tools.dispatcher import ReadCache, ToolDispatcher
+from noscope.ui.console import ask_user
 
 if TYPE_CHECKING:
     from noscope.ui.console import ConsoleUI
 
 MAX_BUILD_ITERATIONS = 200
 MAX_VERIFY_ITERATIONS = 50
+VERIFY_COMPACT_INTERVAL = 5  # Elide stale tool output every N verify turns
+MAX_HANDOFF_FILES = 50
+MAX_PARALLEL_CHECKS = 4
+CHECK_TIMEOUT = 30
+# Characters of check output kept for the report; the shell tool truncates to this
+CHECK_OUTPUT_CHARS = 1000
+# A check with less time than this left cannot produce a meaningful result
+MIN_CHECK_SECONDS = 2.0
+# VERIFY still gets this long per turn when BUILD or HARDEN overran its slot
+MIN_VERIFY_TURN_SECONDS = 20.0
+
+_RISK_COLORS = {"low": "green", "medium": "yellow", "high": "red"}
+# A VERIFIED: anywhere in the reply wins over a FAILED:, wherever each appears
+_VERIFIED_RE = re.compile(r"\bVERIFIED:\s*(.*)", re.IGNORECASE | re.DOTALL)
+_FAILED_RE = re.compile(r"\bFAILED:\s*(.*)", re.IGNORECASE | re.DOTALL)
+
+# Never descended into when listing the workspace for the handoff report
+_LISTING_SKIP = frozenset({".git", "__pycache__", "node_modules", ".venv", "dist", "build"})
+
+# Static so it stays a byte-identical, cacheable prefix; the workspace goes in a
+# separate system message after it.
+VERIFY_SYSTEM_PROMPT = """\
+You are the FINAL VERIFICATION agent. Your ONE job is to make this project RUN.
+
+This is a live demo. The user NEEDS a clickable working app. BE FAST.
+
+DO THIS IN ORDER — no unnecessary steps:
+1. Check for package.json or requirements.txt (ONE list_directory call)
+2. Install deps immediately (npm install OR python3 -m pip install -r requirements.txt)
+3. Start the app in background and test it:
+   - Node.js: Run "node server.js &" or "npm start &", wait 2s, curl localhost
+   - Python/Flask: Run "nohup python3 app.py > /dev/null 2>&1 &", wait 2s, curl localhost:5000
+   - If it fails, READ THE ERROR, fix the code, try again
+4. Once the server responds to curl, immediately respond with VERIFIED
+
+CRITICAL — LAUNCHING PYTHON APPS:
+- ALWAYS use "python3 app.py" or "python3 main.py" — run the file DIRECTLY
+- NEVER use "python3 -c ..." to launch Flask/FastAPI — it breaks the debug reloader
+- If the app has debug=True, that's fine — just run the file directly
+- To background it: "nohup python3 app.py > /dev/null 2>&1 &" then "sleep 2 && curl -s localhost:5000"
+- If the app runs on a different port (8080, 3000, etc), curl THAT port
+
+DO NOT:
+- Read every file — you don't need to understand all the code
+- Spend time on file listings beyond the root directory
+- Over-analyze — if curl gets a response, it works
+
+FIXING (if needed):
+- Missing module → install it
+- Import error → fix the import
+- Missing template/file → create a minimal one
+- Port already in use → kill the process: "lsof -ti :<PORT> | xargs kill"
+- Max 3 fix attempts, then FAILED
+
+Use python3 (not python) and python3 -m pip (not pip).
+
+RESPOND WITH EXACTLY ONE OF:
+- "VERIFIED: <one-line description>" — the app runs
+- "FAILED: <what's broken>" — unfixable after 3 attempts
+"""
 
 
 class TokenTracker:
     """Accumulates token usage across all LLM calls."""
 
+    __slots__ = ("input_tokens", "output_tokens")
+
     def __init__(self) -> None:
         self.input_tokens = 0
         self.output_tokens = 0
@@ -74,6 +145,9 @@ class PlanPhase:
 class RequestPhase:
     """Present capability requests and collect user approvals."""
 
+    def __init__(self, console: Console | None = None) -> None:
+        self._console = console
+
     async def run(
         self,
         plan: PlanOutput,
@@ -88,22 +162,22 @@ class RequestPhase:
         )
         deadline.advance_phase(Phase.REQUEST)
 
-        grants: list[CapabilityGrant] = []
-
-        for req in plan.requested_capabilities:
-            if auto_approve:
-                approved = True
-            else:
+        if auto_approve:
+            grants = [
+                CapabilityGrant(cap=req.cap, approved=True) for req in plan.requested_capabilities
+            ]
+        else:
+            grants = []
+            for req in plan.requested_capabilities:
                 approved = await self._prompt_user(req)
-
-            grants.append(CapabilityGrant(cap=req.cap, approved=approved))
+                grants.append(CapabilityGrant(cap=req.cap, approved=approved))
 
         event_log.emit(
             phase=Phase.REQUEST.value,
             event_type="phase.complete",
             summary="Capability grants collected",
             data={
-                "grants": [g.model_dump() for g in grants],
+                "grants": [{"cap": g.cap, "approved": g.approved} for g in grants],
             },
         )
 
@@ -111,18 +185,18 @@ class RequestPhase:
 
     async def _prompt_user(self, req: CapabilityRequest) -> bool:
         """Interactive prompt for capability approval."""
-        from rich.console import Console
-        from rich.prompt import Confirm
-
-        console = Console()
-        risk_colors = {"low": "green", "medium": "yellow", "high": "red"}
-        color = risk_colors.get(req.risk, "white")
+        if self._console is None:
+            self._console = Console()
+        console = self._console
+        color = _RISK_COLORS.get(req.risk, "white")
 
         console.print(f"\n  [{color}]●[/{color}] {req.cap}", style="bold")
         console.print(f"    Justification: {req.why}")
         console.print(f"    Risk: [{color}]{req.risk}[/{color}]")
 
-        return Confirm.ask("    Approve?", default=True)
+        # Waiting on stdin off the loop keeps background work running, and Ctrl+C
+        # doesn't have to wait for the answer
+        return bool(await ask_user(Confirm.ask, "    Approve?", default=True, console=console))
 
 
 class HardenPhase:
@@ -137,7 +211,14 @@ class HardenPhase:
         event_log: EventLog,
         deadline: Deadline,
         ui: ConsoleUI | None = None,
+        max_parallel: int = MAX_PARALLEL_CHECKS,
     ) -> list[dict[str, Any]]:
+        """Run every cmd: acceptance check. Returns one result per check, in order.
+
+        Checks run serially in declared order, since later checks often depend
+        on earlier ones (install, then import). Consecutive plan checks marked
+        ``independent`` run together, up to ``max_parallel`` at once.
+        """
         event_log.emit(
             phase=Phase.HARDEN.value,
             event_type="phase.start",
@@ -149,36 +230,38 @@ class HardenPhase:
 
         # Collect all cmd: checks from spec and plan
         checks: list[tuple[str, str]] = []
+        independent: list[bool] = []
 
         for ac in spec.acceptance:
             if ac.is_cmd and ac.command:
                 checks.append((ac.raw, ac.command))
+                independent.append(False)
 
         for ap in plan.acceptance_plan:
             if ap.cmd:
                 checks.append((ap.name, ap.cmd))
+                independent.append(ap.independent)
 
-        for name, cmd in checks:
-            if deadline.is_expired() or deadline.should_transition(Phase.HARDEN):
-                results.append({"name": name, "cmd": cmd, "passed": False, "skipped": True})
-                continue
+        semaphore = asyncio.Semaphore(max_parallel)
 
-            if ui:
-                ui.tool_activity("check", name, deadline)
+        async def run_check(name: str, cmd: str) -> dict[str, Any]:
+            async with semaphore:
+                # Checks still queued when time runs out are skipped, not started
+                remaining = deadline.remaining()
+                if remaining < MIN_CHECK_SECONDS or deadline.phase_over(Phase.HARDEN):
+                    return {"name": name, "cmd": cmd, "passed": False, "skipped": True}
 
-            result = await dispatcher.dispatch(
-                "exec_command", {"command": cmd, "timeout": 30}, context
-            )
-            passed = result.status == "ok"
-            results.append(
-                {
-                    "name": name,
-                    "cmd": cmd,
-                    "passed": passed,
-                    "output": result.display[:1000],
-                }
-            )
+                if ui:
+                    ui.tool_activity("check", name, deadline)
 
+                timeout = max(1, min(CHECK_TIMEOUT, int(remaining)))
+                result = await dispatcher.dispatch(
+                    "exec_command",
+                    {"command": cmd, "timeout": timeout, "max_output": CHECK_OUTPUT_CHARS},
+                    context,
+                )
+
+            passed = result.status == "ok"
             event_log.emit(
                 phase=Phase.HARDEN.value,
                 event_type="acceptance.check",
@@ -186,11 +269,45 @@ class HardenPhase:
                 data={"name": name, "cmd": cmd},
                 result={"passed": passed},
             )
+            return {
+                "name": name,
+                "cmd": cmd,
+                "passed": passed,
+                "output": result.display[:CHECK_OUTPUT_CHARS],
+            }
+
+        # A check not marked independent runs alone; consecutive independent
+        # checks are gathered as one batch
+        batches: list[list[tuple[str, str]]] = []
+        for i, check in enumerate(checks):
+            if independent[i] and i > 0 and independent[i - 1]:
+                batches[-1].append(check)
+            else:
+                batches.append([check])
+
+        outcomes: list[dict[str, Any] | BaseException] = []
+        for batch in batches:
+            outcomes.extend(
+                await asyncio.gather(
+                    *(run_check(name, cmd) for name, cmd in batch), return_exceptions=True
+                )
+            )
+        passed_count = 0
+        for (name, cmd), outcome in zip(checks, outcomes, strict=True):
+            if isinstance(outcome, BaseException):
+                outcome = {
+                    "name": name,
+                    "cmd": cmd,
+                    "passed": False,
+                    "output": f"Check could not run: {outcome}",
+                }
+            passed_count += bool(outcome["passed"])
+            results.append(outcome)
 
         event_log.emit(
             phase=Phase.HARDEN.value,
             event_type="phase.complete",
-            summary=f"Harden complete: {sum(1 for r in results if r.get('passed'))}/{len(results)} passed",
+            summary=f"Harden complete: {passed_count}/{len(results)} passed",
         )
 
         return results
@@ -221,66 +338,50 @@ class VerifyPhase:
             summary="Starting MVP verification",
         )
 
-        system = f"""\
-You are the FINAL VERIFICATION agent. Your ONE job is to make this project RUN.
-The project is in: {context.workspace}
-
-This is a live demo. The user NEEDS a clickable working app. BE FAST.
-
-DO THIS IN ORDER — no unnecessary steps:
-1. Check for package.json or requirements.txt (ONE list_directory call)
-2. Install deps immediately (npm install OR python3 -m pip install -r requirements.txt)
-3. Start the app in background and test it:
-   - Node.js: Run "node server.js &" or "npm start &", wait 2s, curl localhost
-   - Python/Flask: Run "nohup python3 app.py > /dev/null 2>&1 &", wait 2s, curl localhost:5000
-   - If it fails, READ THE ERROR, fix the code, try again
-4. Once the server responds to curl, immediately respond with VERIFIED
-
-CRITICAL — LAUNCHING PYTHON APPS:
-- ALWAYS use "python3 app.py" or "python3 main.py" — run the file DIRECTLY
-- NEVER use "python3 -c ..." to launch Flask/FastAPI — it breaks the debug reloader
-- If the app has debug=True, that's fine — just run the file directly
-- To background it: "nohup python3 app.py > /dev/null 2>&1 &" then "sleep 2 && curl -s localhost:5000"
-- If the app runs on a different port (8080, 3000, etc), curl THAT port
-
-DO NOT:
-- Read every file — you don't need to understand all the code
-- Spend time on file listings beyond the root directory
-- Over-analyze — if curl gets a response, it works
-
-FIXING (if needed):
-- Missing module → install it
-- Import error → fix the import
-- Missing template/file → create a minimal one
-- Port already in use → kill the process: "lsof -ti :<PORT> | xargs kill"
-- Max 3 fix attempts, then FAILED
-
-Use python3 (not python) and python3 -m pip (not pip).
-
-RESPOND WITH EXACTLY ONE OF:
-- "VERIFIED: <one-line description>" — the app runs
-- "FAILED: <what's broken>" — unfixable after 3 attempts
-"""
-
         messages: list[Message] = [
-            Message(role="system", content=system),
+            Message(role="system", content=VERIFY_SYSTEM_PROMPT, cache=True),
+            Message(role="system", content=f"The project is in: {context.workspace}"),
             Message(
                 role="user",
                 content=f"Get {spec.name} running NOW. Install deps, start server, curl it. Go.",
             ),
         ]
 
-        tool_schemas = [
-            ToolSchema(name=s["name"], description=s["description"], parameters=s["parameters"])
-            for s in dispatcher.to_schemas()
-        ]
+        tool_schemas = list(dispatcher.tool_schemas())
+        # Files and listings re-read while iterating on a fix come from here
+        # until the next write or command
+        read_cache = ReadCache()
 
         # Aggressive agent loop — more iterations than build phase gets
         for _i in range(MAX_VERIFY_ITERATIONS):
-            if deadline.is_expired():
+            budget = _verify_turn_budget(deadline)
+            if budget <= 0:
+                if _i == 0:
+                    event_log.emit(
+                        phase=Phase.VERIFY.value,
+                        event_type="verify.skipped",
+                        summary="No time left to verify before HANDOFF",
+                    )
+                    return False, "Skipped: no time left to verify before HANDOFF"
                 return False, "Deadline expired during verification"
 
-            response = await provider.complete(messages, tools=tool_schemas)
+            messages[-1].cache = True  # rolling breakpoint; messages are append-only
+            early = EarlyToolCalls(
+                dispatcher.is_parallel_safe,
+                functools.partial(_dispatch_call, dispatcher, context, read_cache),
+            )
+            try:
+                # A slow model call must not eat into the time reserved for HANDOFF
+                response = await asyncio.wait_for(
+                    complete_turn(provider, messages, tool_schemas, early), timeout=budget
+                )
+            except TimeoutError:
+                event_log.emit(
+                    phase=Phase.VERIFY.value,
+                    event_type="verify.timeout",
+                    summary="VERIFY budget expired waiting for the model",
+                )
+                return False, "Deadline expired during verification"
             if tokens:
                 tokens.add(response.usage)
 
@@ -293,19 +394,20 @@ RESPOND WITH EXACTLY ONE OF:
                     ui.tool_activity("verify", response.content[:80], deadline)
 
                 # Check for final verdict
-                content_upper = response.content.upper()
-                if "VERIFIED:" in content_upper:
-                    idx = response.content.upper().index("VERIFIED:")
-                    msg = response.content[idx + 9 :].strip()
+                verdict = _VERIFIED_RE.search(response.content)
+                if verdict:
+                    msg = verdict.group(1).strip()
                     event_log.emit(
                         phase=Phase.VERIFY.value,
                         event_type="verify.pass",
                         summary=f"MVP verified: {msg}",
                     )
+                    early.cancel()
                     return True, msg
-                if "FAILED:" in content_upper:
-                    idx = response.content.upper().index("FAILED:")
-                    msg = response.content[idx + 7 :].strip()
+                verdict = _FAILED_RE.search(response.content)
+                if verdict:
+                    early.cancel()
+                    msg = verdict.group(1).strip()
                     event_log.emit(
                         phase=Phase.VERIFY.value,
                         event_type="verify.fail",
@@ -318,21 +420,42 @@ RESPOND WITH EXACTLY ONE OF:
                     break
                 continue
 
-            for tc in response.tool_calls:
-                if ui:
+            if ui:
+                for tc in response.tool_calls:
                     ui.tool_activity(tc.name, tool_summary(tc.name, tc.arguments), deadline)
-                result = await dispatcher.dispatch(tc.name, tc.arguments, context)
-                messages.append(
-                    Message(
-                        role="tool",
-                        content=result.display or json.dumps(result.data),
-                        tool_call_id=tc.id,
-                    )
+            # Calls started during streaming are always a prefix of the turn
+            results = [await early.tasks[tc.id] for tc in response.tool_calls[: len(early.tasks)]]
+            results += await dispatcher.dispatch_batch(
+                [(tc.name, tc.arguments) for tc in response.tool_calls[len(early.tasks) :]],
+                context,
+                read_cache,
+            )
+            messages.extend(
+                Message(
+                    role="tool",
+                    content=result.as_text,
+                    tool_call_id=tc.id,
                 )
+                for tc, result in zip(response.tool_calls, results, strict=True)
+            )
+
+            # Compacting in batches keeps the cached prefix stable between rewrites
+            if (_i + 1) % VERIFY_COMPACT_INTERVAL == 0:
+                elide_old_tool_results(messages)
 
         return False, "Verification did not complete"
 
 
+def _verify_turn_budget(deadline: Deadline) -> float:
+    """Seconds the next VERIFY turn may take.
+
+    VERIFY's own slot, but at least MIN_VERIFY_TURN_SECONDS when earlier phases
+    overran it, and never into HANDOFF's share of the timebox.
+    """
+    phase_budget = max(deadline.phase_remaining(Phase.VERIFY), MIN_VERIFY_TURN_SECONDS)
+    return min(deadline.remaining() - deadline.phase_share(Phase.HANDOFF), phase_budget)
+
+
 class HandoffPhase:
     """Generate the handoff report — ALWAYS runs."""
 
@@ -357,20 +480,30 @@ class HandoffPhase:
         )
         deadline.advance_phase(Phase.HANDOFF)
 
-        completed = [t for t in tasks if t.completed]
-        incomplete = [t for t in tasks if not t.completed]
-        passed = [r for r in acceptance_results if r.get("passed")]
+        completed: list[PlanTask] = []
+        incomplete: list[PlanTask] = []
+        for t in tasks:
+            (completed if t.completed else incomplete).append(t)
+
+        if deadline.is_expired():
+            # No time left for an LLM round-trip — write the template report instead
+            event_log.emit(
+                phase=Phase.HANDOFF.value,
+                event_type="handoff.fallback",
+                summary="Deadline passed, skipping LLM handoff report",
+            )
+            report = self._fallback_report(spec, completed, incomplete, acceptance_results)
+            return await self._write_report(report, output_path, event_log)
 
         # Get actual file listing from workspace
         file_listing = "(unknown)"
+        root_names: frozenset[str] = frozenset()
         if workspace and workspace.exists():
             try:
-                files = sorted(
-                    str(p.relative_to(workspace))
-                    for p in workspace.rglob("*")
-                    if p.is_file() and ".git" not in p.parts and "__pycache__" not in p.parts
-                )
-                file_listing = "\n".join(f"- {f}" for f in files[:50])
+                files, truncated, root_names = _list_workspace(workspace, MAX_HANDOFF_FILES)
+                file_listing = "\n".join(f"- {f}" for f in files)
+                if truncated:
+                    file_listing += "\n- ..."
             except Exception as e:
                 event_log.emit(
                     phase=Phase.HANDOFF.value,
@@ -379,13 +512,9 @@ class HandoffPhase:
                 )
                 file_listing = "(could not list)"
 
-        # Check for key project files to determine stack
-        has_requirements = (
-            workspace and (workspace / "requirements.txt").exists() if workspace else False
-        )
-        has_package_json = (
-            workspace and (workspace / "package.json").exists() if workspace else False
-        )
+        # Determine the stack from the root entries the listing already scanned
+        has_requirements = "requirements.txt" in root_names
+        has_package_json = "package.json" in root_names
 
         stack_hint = ""
         if has_requirements and not has_package_json:
@@ -398,13 +527,23 @@ class HandoffPhase:
             verified, msg = verify_result
             verify_info = f"\nMVP Verification: {'PASSED' if verified else 'FAILED'} — {msg}"
 
+        passed_count = 0
+        acceptance_lines: list[str] = []
+        for r in acceptance_results:
+            ok = bool(r.get("passed"))
+            passed_count += ok
+            acceptance_lines.append(f"- {'✓' if ok else '✗'} {r['name']}")
+        completed_list = "\n".join([f"- {t.title}" for t in completed]) or "(none)"
+        incomplete_list = "\n".join([f"- {t.title}" for t in incomplete]) or "(none)"
+        acceptance_list = "\n".join(acceptance_lines) or "(none)"
+
         report_data = f"""\
 Generate a concise handoff report in markdown for this build run.
 
 Project: {spec.name}
 Timebox: {spec.timebox}
 Tasks completed: {len(completed)}/{len(tasks)}
-Acceptance checks passed: {len(passed)}/{len(acceptance_results)}
+Acceptance checks passed: {passed_count}/{len(acceptance_results)}
 {verify_info}
 
 {stack_hint}
@@ -413,13 +552,13 @@ Files in workspace:
 {file_listing}
 
 Completed tasks:
-{chr(10).join(f"- {t.title}" for t in completed) or "(none)"}
+{completed_list}
 
 Incomplete tasks:
-{chr(10).join(f"- {t.title}" for t in incomplete) or "(none)"}
+{incomplete_list}
 
 Acceptance results:
-{chr(10).join(f"- {'✓' if r.get('passed') else '✗'} {r['name']}" for r in acceptance_results) or "(none)"}
+{acceptance_list}
 
 IMPORTANT: Base the "How to Run It" section ONLY on the actual files listed above. Do NOT guess — if you see requirements.txt, use pip. If you see package.json, use npm. Never mix them up.
 
@@ -440,10 +579,20 @@ Write the report with these sections:
                 ),
                 Message(role="user", content=report_data),
             ]
-            response = await provider.complete(messages)
+            # Past the deadline the template report is the better outcome
+            response = await asyncio.wait_for(
+                provider.complete(messages), timeout=deadline.remaining()
+            )
             if tokens:
                 tokens.add(response.usage)
             report = response.content
+        except TimeoutError:
+            event_log.emit(
+                phase=Phase.HANDOFF.value,
+                event_type="handoff.fallback",
+                summary="Deadline passed during LLM handoff report, using fallback",
+            )
+            report = self._fallback_report(spec, completed, incomplete, acceptance_results)
         except Exception as e:
             event_log.emit(
                 phase=Phase.HANDOFF.value,
@@ -452,7 +601,11 @@ Write the report with these sections:
             )
             report = self._fallback_report(spec, completed, incomplete, acceptance_results)
 
-        output_path.write_text(report, encoding="utf-8")
+        return await self._write_report(report, output_path, event_log)
+
+    async def _write_report(self, report: str, output_path: Path, event_log: EventLog) -> str:
+        # Off the event loop: the report can be large and the disk slow
+        await asyncio.to_thread(output_path.write_text, report, encoding="utf-8")
 
         event_log.emit(
             phase=Phase.HANDOFF.value,
@@ -509,3 +662,45 @@ Write the report with these sections:
         lines.append("- Address incomplete tasks")
 
         return "\n".join(lines)
+
+
+async def _dispatch_call(
+    dispatcher: ToolDispatcher, context: ToolContext, cache: ReadCache, tc: ToolCall
+) -> ToolResult:
+    return await dispatcher.dispatch(tc.name, tc.arguments, context, cache)
+
+
+def _list_workspace(workspace: Path, limit: int) -> tuple[list[str], bool, frozenset[str]]:
+    """Return the first ``limit`` workspace files in sorted order, whether there are
+    more, and the names of the workspace root's entries.
+
+    Siblings are visited in the order their full relative paths sort (a directory
+    sorts as ``name/``), so stopping early gives the same result as sorting the
+    complete listing, without walking dependency or VCS trees. The root is always
+    scanned first, so its names are complete even when the listing is cut short.
+    """
+    files: list[str] = []
+    root_names: set[str] = set()
+    stack: list[tuple[str, str, bool]] = [(os.fspath(workspace), "", True)]
+    while stack:
+        path, rel, is_dir = stack.pop()
+        if not is_dir:
+            if len(files) == limit:
+                return files, True, frozenset(root_names)
+            files.append(rel)
+            continue
+
+        children: list[tuple[str, str, bool]] = []
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if not rel:
+                    root_names.add(entry.name)
+                if entry.name in _LISTING_SKIP:
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    children.append((rel + entry.name + "/", entry.path, True))
+                elif entry.is_file():
+                    children.append((rel + entry.name, entry.path, False))
+        for child_rel, child_path, child_is_dir in sorted(children, reverse=True):
+            stack.append((child_path, child_rel, child_is_dir))
+    return files, False, frozenset(root_names)
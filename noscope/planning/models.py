@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import json
+from functools import cached_property
 from typing import Literal
 
-from pydantic import BaseModel
+from pydantic import BaseModel, model_validator
 
 from noscope.capabilities import CapabilityRequest
 
@@ -27,6 +29,8 @@ class AcceptancePlan(BaseModel):
     name: str
     cmd: str | None = None
     must_pass: bool = True
+    # Safe to run alongside neighbouring independent checks
+    independent: bool = False
 
 
 class PlanOutput(BaseModel):
@@ -37,3 +41,24 @@ class PlanOutput(BaseModel):
     mvp_definition: list[str] = []
     exclusions: list[str] = []
     acceptance_plan: list[AcceptancePlan] = []
+
+    @model_validator(mode="after")
+    def check_unique_task_ids(self) -> PlanOutput:
+        # Dependencies and completion are tracked by id, so a repeat would shadow a task
+        seen: set[str] = set()
+        for task in self.tasks:
+            if task.id in seen:
+                raise ValueError(f"Duplicate task id: {task.id}")
+            seen.add(task.id)
+        return self
+
+    # Serialized once so every prompt built from the plan is byte-identical,
+    # which provider-side prompt caching depends on. The plan is not edited
+    # after PLAN, so the cache never goes stale.
+    @cached_property
+    def mvp_definition_json(self) -> str:
+        return json.dumps(self.mvp_definition)
+
+    @cached_property
+    def exclusions_json(self) -> str:
+        return json.dumps(self.exclusions)
@@ -5,7 +5,9 @@ from __future__ import annotations
 import json
 from typing import TYPE_CHECKING
 
-from noscope.llm.base import LLMProvider, Message
+from pydantic import ValidationError
+
+from noscope.llm.base import LLMProvider, LLMResponse, Message
 from noscope.planning.models import PlanOutput
 from noscope.spec.models import SpecInput
 
@@ -29,7 +31,7 @@ Given a project specification, produce a structured JSON plan. Your output must
   "mvp_definition": ["What counts as done"],
   "exclusions": ["What is explicitly NOT being built"],
   "acceptance_plan": [
-    {"name": "check name", "cmd": "shell command or null", "must_pass": true}
+    {"name": "check name", "cmd": "shell command or null", "must_pass": true, "independent": false}
   ]
 }
 
@@ -51,6 +53,7 @@ ACCEPTANCE CHECKS — keep them simple:
   - One check for deps: "python3 -m pip install -r requirements.txt" or "npm install"
   - One check for startup: "timeout 5 python3 app.py" or "node server.js &; sleep 2; curl -s localhost:PORT"
 - Do NOT add checks for individual features, templates, or code quality
+- Checks run in order. Set "independent": true only for a check that neither needs nor affects any other check
 
 STACK SELECTION — match complexity to timebox:
 - ≤5m: 2-3 MVP tasks. Use the SIMPLEST stack: vanilla HTML/CSS/JS, single Python file with Flask, or Node.js with Express. NO TypeScript, NO React, NO build tools, NO Tailwind.
@@ -69,6 +72,9 @@ Mark stretch tasks for features to add if time permits.
 Respond ONLY with the JSON object, no markdown fences or explanation.
 """
 
+# Lets providers with a JSON output mode guarantee a parseable first response
+PLAN_JSON_SCHEMA = PlanOutput.model_json_schema()
+
 
 async def plan(
     spec: SpecInput, provider: LLMProvider, tokens: TokenTracker | None = None
@@ -85,38 +91,61 @@ Spec body:
 {spec.body}
 """
 
+    # The fixed prompt is cached across runs, the spec across retries
     messages = [
-        Message(role="system", content=PLAN_SYSTEM_PROMPT),
-        Message(role="user", content=user_content),
+        Message(role="system", content=PLAN_SYSTEM_PROMPT, cache=True),
+        Message(role="user", content=user_content, cache=True),
     ]
 
     max_retries = 2
-    last_error: Exception | None = None
+    last_error: ValidationError | None = None
 
     for attempt in range(max_retries + 1):
-        response = await provider.complete(messages)
+        response = await provider.complete(messages, json_schema=PLAN_JSON_SCHEMA)
         if tokens:
             tokens.add(response.usage)
         try:
-            raw = response.content.strip()
-            # Strip markdown fences if present
-            if raw.startswith("```"):
-                lines = raw.split("\n")
-                raw = "\n".join(lines[1:-1]) if lines[-1].strip() == "```" else "\n".join(lines[1:])
-
-            data = json.loads(raw)
-            return PlanOutput.model_validate(data)
-        except (json.JSONDecodeError, Exception) as e:
+            return parse_plan(response.content)
+        except ValidationError as e:
             last_error = e
             if attempt < max_retries:
                 messages.append(Message(role="assistant", content=response.content))
                 messages.append(
                     Message(
                         role="user",
-                        content=f"Your response was not valid JSON. Error: {e}. Please try again with valid JSON only.",
+                        content=f"Your response was not valid JSON. Error: {_describe_error(e)}. Please try again with valid JSON only.",
                     )
                 )
 
     raise ValueError(
         f"Failed to generate valid plan after {max_retries + 1} attempts: {last_error}"
     )
+
+
+def parse_plan(content: str) -> PlanOutput:
+    """Parse a plan response, tolerating markdown fences. Raises ValidationError."""
+    raw = content.strip()
+    # Strip markdown fences if present
+    if raw.startswith("```"):
+        lines = raw.split("\n")
+        raw = "\n".join(lines[1:-1]) if lines[-1].strip() == "```" else "\n".join(lines[1:])
+
+    # Parsed and validated in one pass, without an intermediate dict
+    return PlanOutput.model_validate_json(raw)
+
+
+def is_valid_plan(response: LLMResponse) -> bool:
+    """Whether a response parses to a valid plan; used to keep bad plans out of caches."""
+    try:
+        parse_plan(response.content)
+    except ValidationError:
+        return False
+    return True
+
+
+def _describe_error(error: ValidationError) -> str:
+    """Summarize a parse error for the repair prompt, one entry per invalid field."""
+    return "; ".join(
+        f"{'.'.join(map(str, err['loc']))}: {err['msg']}" if err["loc"] else err["msg"]
+        for err in error.errors()
+    )
@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from typing import Any
 
+from noscope import fastjson
 from noscope.capabilities import CapabilityGrant
 from noscope.planning.models import PlanOutput
 from noscope.spec.models import SpecInput
@@ -31,5 +31,5 @@ def generate_contract(
         "spec_acceptance": [a.model_dump() for a in spec.acceptance],
     }
 
-    output_path.write_text(json.dumps(contract, indent=2), encoding="utf-8")
+    output_path.write_bytes(fastjson.dumps_indented(contract))
     return contract
@@ -2,10 +2,16 @@
 
 from __future__ import annotations
 
+import re
 from typing import Literal
 
 from pydantic import BaseModel, field_validator
 
+# Number-unit pairs in any order; a trailing bare number counts as minutes
+_DURATION_RE = re.compile(r"(?:\d+[hms])*\d*")
+_DURATION_PART_RE = re.compile(r"(\d+)([hms]?)")
+_UNIT_SECONDS = {"h": 3600, "m": 60, "s": 1, "": 60}
+
 
 class AcceptanceCheck(BaseModel):
     """A single acceptance criterion from the spec."""
@@ -17,7 +23,7 @@ class AcceptanceCheck(BaseModel):
     @classmethod
     def from_string(cls, s: str) -> AcceptanceCheck:
         s = s.strip()
-        if s.lower().startswith("cmd:"):
+        if s[:4].lower() == "cmd:":  # only the prefix needs case-folding
             cmd = s[4:].strip()
             return cls(raw=s, is_cmd=True, command=cmd)
         return cls(raw=s)
@@ -53,33 +59,10 @@ class SpecInput(BaseModel):
 def _parse_duration(s: str) -> int:
     """Parse a duration string like '30m', '1h', '1h30m', '90s' into seconds."""
     s = s.strip().lower()
-    total = 0
-    current = ""
-    for c in s:
-        if c.isdigit():
-            current += c
-        elif c == "h":
-            if not current:
-                raise ValueError(f"Invalid duration: {s}")
-            total += int(current) * 3600
-            current = ""
-        elif c == "m":
-            if not current:
-                raise ValueError(f"Invalid duration: {s}")
-            total += int(current) * 60
-            current = ""
-        elif c == "s":
-            if not current:
-                raise ValueError(f"Invalid duration: {s}")
-            total += int(current)
-            current = ""
-        else:
-            raise ValueError(f"Invalid duration character: {c}")
-
-    # Bare number defaults to minutes
-    if current:
-        total += int(current) * 60
+    if not _DURATION_RE.fullmatch(s):
+        raise ValueError(f"Invalid duration: {s}")
 
+    total = sum(int(n) * _UNIT_SECONDS[unit] for n, unit in _DURATION_PART_RE.findall(s))
     if total <= 0:
         raise ValueError(f"Duration must be positive: {s}")
 
@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import graphlib
+import heapq
+from collections import Counter
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -23,6 +25,24 @@ if TYPE_CHECKING:
 # Keep at 2 to avoid API rate limits with concurrent LLM streams.
 MAX_WORKERS = 2
 
+# Identical for every worker, so with the tool schemas ahead of it this forms a
+# prompt-cache prefix shared across agents; per-worker details follow separately.
+WORKER_SYSTEM_PROMPT = """\
+You are a worker agent. You are one of several agents building this project IN PARALLEL.
+
+Other agents are working on different tasks simultaneously. Focus ONLY on your assigned tasks.
+
+RULES:
+- The project structure and dependencies are already set up — do NOT reinstall or reconfigure
+- Write code for YOUR tasks only
+- Do NOT modify files that other agents might be working on
+- Call mark_task_complete after finishing each task
+- If you need a file that doesn't exist yet, create it — another agent may not have written it yet
+- NEVER use interactive scaffolding tools (create-react-app, npm create, etc)
+- Use "python3" not "python", "python3 -m pip" not "pip"
+- Build something impressive — good styling, thoughtful UX
+"""
+
 
 class Supervisor:
     """Orchestrates multiple build agents for parallel task execution.
@@ -164,8 +184,8 @@ class Supervisor:
                     ui=self.ui,
                     tokens=self.tokens,
                 )
-                prompt = self._worker_prompt(plan, workspace, stream, i)
-                worker_coros.append(agent.run(stream, prompt))
+                worker_context = self._worker_context(plan, workspace, stream, i)
+                worker_coros.append(agent.run(stream, WORKER_SYSTEM_PROMPT, worker_context))
 
             # Audit agent runs in parallel
             audit = AuditAgent(
@@ -228,46 +248,24 @@ class Supervisor:
     def _partition_tasks(self, tasks: list[PlanTask]) -> list[list[PlanTask]]:
         """Partition tasks into parallel work streams.
 
-        Uses task dependencies if available, otherwise round-robin assignment.
-        Limits to MAX_WORKERS streams.
+        Workers never wait on each other, so a task shares a stream with
+        everything it depends on. Each dependency-connected group is kept
+        whole, and groups are spread over at most MAX_WORKERS streams, largest
+        first onto the shortest stream. Within a stream, MVP tasks (and what
+        they depend on) come before stretch tasks, so the timebox cuts stretch
+        work first.
         """
         if not tasks:
             return []
 
-        # Group by dependency chains
-        streams: list[list[PlanTask]] = []
-        assigned: set[str] = set()
-
-        # First pass: group tasks that depend on each other
-        for task in tasks:
-            if task.id in assigned:
-                continue
-
-            chain = [task]
-            assigned.add(task.id)
-
-            # Find tasks that depend on this one
-            for other in tasks:
-                if other.id not in assigned and task.id in other.depends_on:
-                    chain.append(other)
-                    assigned.add(other.id)
-
-            streams.append(chain)
-
-        # If we have more streams than workers, merge small ones
-        while len(streams) > MAX_WORKERS:
-            # Merge the two shortest streams
-            streams.sort(key=len)
-            smallest = streams.pop(0)
-            streams[0] = smallest + streams[0]
-
-        # If we have unassigned tasks, distribute round-robin
-        unassigned = [t for t in tasks if t.id not in assigned]
-        for i, task in enumerate(unassigned):
-            idx = i % len(streams) if streams else 0
-            if not streams:
-                streams.append([])
-            streams[idx].append(task)
+        order = _dependency_order(tasks)
+        position = {t.id: i for i, t in enumerate(order)}
+        groups = _dependency_groups(order)
+        streams: list[list[PlanTask]] = [[] for _ in range(min(MAX_WORKERS, len(groups)))]
+        for group in sorted(groups, key=len, reverse=True):
+            min(streams, key=len).extend(group)
+        for stream in streams:
+            stream.sort(key=lambda t: position[t.id])
 
         return streams
 
@@ -287,7 +285,7 @@ YOUR JOB:
 - Call mark_task_complete when all files are written
 - Be FAST — other agents are waiting
 
-MVP definition: {json.dumps(plan.mvp_definition)}
+MVP definition: {plan.mvp_definition_json}
 """
 
     def _setup_deps_prompt(self, plan: PlanOutput, workspace: Path) -> str:
@@ -310,28 +308,79 @@ RULES:
 - If both package.json and requirements.txt exist, install BOTH
 """
 
-    def _worker_prompt(
+    def _worker_context(
         self, plan: PlanOutput, workspace: Path, tasks: list[PlanTask], worker_idx: int
     ) -> str:
         task_ids = ", ".join(t.id for t in tasks)
         return f"""\
-You are worker agent {worker_idx}. You are one of several agents building this project IN PARALLEL.
+You are worker agent {worker_idx}.
 
 Workspace: {workspace}
 Your assigned tasks: {task_ids}
 
-Other agents are working on different tasks simultaneously. Focus ONLY on your assigned tasks.
+MVP definition: {plan.mvp_definition_json}
+Exclusions: {plan.exclusions_json}
+"""
 
-RULES:
-- The project structure and dependencies are already set up — do NOT reinstall or reconfigure
-- Write code for YOUR tasks only
-- Do NOT modify files that other agents might be working on
-- Call mark_task_complete after finishing each task
-- If you need a file that doesn't exist yet, create it — another agent may not have written it yet
-- NEVER use interactive scaffolding tools (create-react-app, npm create, etc)
-- Use "python3" not "python", "python3 -m pip" not "pip"
-- Build something impressive — good styling, thoughtful UX
 
-MVP definition: {json.dumps(plan.mvp_definition)}
-Exclusions: {json.dumps(plan.exclusions)}
-"""
+def _dependency_order(tasks: list[PlanTask]) -> list[PlanTask]:
+    """Order tasks so each follows its dependencies, MVP work first when free.
+
+    A stretch task that an MVP task depends on counts as MVP work. Dependencies
+    outside ``tasks`` (the setup task) have already run and are ignored. A
+    cyclic plan keeps its original order. Task ids must be unique.
+    """
+    by_id = {t.id: t for t in tasks}
+    if len(by_id) != len(tasks):
+        repeated = [task_id for task_id, n in Counter(t.id for t in tasks).items() if n > 1]
+        raise ValueError(f"Duplicate task ids: {', '.join(repeated)}")
+    graph = {t.id: [d for d in t.depends_on if d in by_id] for t in tasks}
+
+    mvp = {t.id for t in tasks if t.priority == "mvp"}
+    pending = list(mvp)
+    while pending:
+        for dep in graph[pending.pop()]:
+            if dep not in mvp:
+                mvp.add(dep)
+                pending.append(dep)
+
+    sorter = graphlib.TopologicalSorter(graph)
+    try:
+        sorter.prepare()
+    except graphlib.CycleError:
+        return list(tasks)
+
+    rank = {t.id: (t.id not in mvp, i) for i, t in enumerate(tasks)}
+    order: list[PlanTask] = []
+    ready: list[tuple[tuple[bool, int], str]] = []
+    while sorter.is_active():
+        for task_id in sorter.get_ready():
+            heapq.heappush(ready, (rank[task_id], task_id))
+        _, task_id = heapq.heappop(ready)
+        order.append(by_id[task_id])
+        sorter.done(task_id)
+    return order
+
+
+def _dependency_groups(order: list[PlanTask]) -> list[list[PlanTask]]:
+    """Group tasks connected by dependencies, keeping each group in ``order``."""
+    by_id = {t.id: t for t in order}
+    graph = {t.id: [d for d in t.depends_on if d in by_id] for t in order}
+
+    # Union-find: each task points towards its group's root
+    root = {task_id: task_id for task_id in by_id}
+
+    def find(task_id: str) -> str:
+        while root[task_id] != task_id:
+            root[task_id] = root[root[task_id]]
+            task_id = root[task_id]
+        return task_id
+
+    for task_id, deps in graph.items():
+        for dep in deps:
+            root[find(task_id)] = find(dep)
+
+    groups: dict[str, list[PlanTask]] = {}
+    for t in order:
+        groups.setdefault(find(t.id), []).append(t)
+    return list(groups.values())
@@ -3,10 +3,13 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass, field
+from functools import cached_property
 from pathlib import Path
 from typing import Any, Literal
 
+from noscope import fastjson
 from noscope.capabilities import Capability, CapabilityStore
 from noscope.deadline import Deadline
 from noscope.logging.events import EventLog
@@ -20,7 +23,7 @@ class ToolContext:
     capabilities: CapabilityStore
     event_log: EventLog
     deadline: Deadline
-    secrets: dict[str, str] = field(default_factory=dict)
+    secrets: Mapping[str, str] = field(default_factory=dict)
     danger_mode: bool = False
 
 
@@ -32,6 +35,15 @@ class ToolResult:
     data: dict[str, Any] = field(default_factory=dict)
     display: str = ""
 
+    @cached_property
+    def as_text(self) -> str:
+        """What the model sees: ``display``, else ``data`` as JSON.
+
+        Built once per result, so a read served again from a ReadCache is not
+        re-serialized.
+        """
+        return self.display or fastjson.dumps(self.data)
+
     @classmethod
     def ok(cls, display: str = "", **data: Any) -> ToolResult:
         return cls(status="ok", data=data, display=display)
@@ -47,6 +59,8 @@ class Tool(ABC):
     name: str
     description: str
     required_capability: Capability
+    # Read-only tools may run concurrently with each other within one turn
+    parallel_safe: bool = False
 
     @abstractmethod
     def parameters_schema(self) -> dict[str, Any]:
@@ -59,19 +73,26 @@ class Tool(ABC):
         ...
 
 
+def _summarize_command(args: dict[str, Any]) -> str:
+    cmd = str(args.get("command", ""))
+    return cmd if len(cmd) <= 80 else cmd[:77] + "..."
+
+
+_SUMMARIES: dict[str, Callable[[dict[str, Any]], str]] = {
+    "write_file": lambda args: f"writing {args.get('path', '?')}",
+    "read_file": lambda args: f"reading {args.get('path', '?')}",
+    "exec_command": _summarize_command,
+    "list_directory": lambda args: f"listing {args.get('path', '.')}",
+    "create_directory": lambda args: f"creating {args.get('path', '?')}",
+    "git_init": lambda _: "git init",
+    "git_status": lambda _: "git status",
+    "git_add": lambda _: "git add",
+    "git_commit": lambda _: "git commit",
+    "git_diff": lambda _: "git diff",
+}
+
+
 def tool_summary(name: str, args: dict[str, Any]) -> str:
     """Create a brief human-readable summary of a tool call."""
-    if name == "write_file":
-        return f"writing {args.get('path', '?')}"
-    if name == "read_file":
-        return f"reading {args.get('path', '?')}"
-    if name == "exec_command":
-        cmd = args.get("command", "")
-        return str(cmd[:80]) if len(cmd) <= 80 else str(cmd[:77]) + "..."
-    if name == "list_directory":
-        return f"listing {args.get('path', '.')}"
-    if name == "create_directory":
-        return f"creating {args.get('path', '?')}"
-    if name in ("git_init", "git_status", "git_add", "git_commit", "git_diff"):
-        return name.replace("_", " ")
-    return name
+    summarize = _SUMMARIES.get(name)
+    return summarize(args) if summarize else name
@@ -2,23 +2,59 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
 from typing import Any
 
+from noscope.llm.base import ToolSchema
 from noscope.tools.base import Tool, ToolContext, ToolResult
 from noscope.tools.redaction import redact_structured
 
+MAX_PARALLEL_DISPATCH = 8
+
 _MAX_LOG_STRING = 2_000
 _OMIT_FIELDS = {"content", "stdout", "stderr"}
 
 
+class ReadCache:
+    """Per-run memo of successful parallel-safe tool results.
+
+    Keyed on tool name and canonical arguments. Any other tool call clears it,
+    since a write or command may change what a later read would return.
+    """
+
+    def __init__(self) -> None:
+        self._results: dict[tuple[str, str], ToolResult] = {}
+
+    @staticmethod
+    def key(tool_name: str, args: dict[str, Any]) -> tuple[str, str]:
+        return tool_name, json.dumps(args, sort_keys=True, default=str)
+
+    def get(self, key: tuple[str, str]) -> ToolResult | None:
+        return self._results.get(key)
+
+    def put(self, key: tuple[str, str], result: ToolResult) -> None:
+        if result.status == "ok":
+            self._results[key] = result
+
+    def clear(self) -> None:
+        self._results.clear()
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+
 class ToolDispatcher:
     """Registers tools and dispatches calls with capability checks."""
 
     def __init__(self) -> None:
         self._tools: dict[str, Tool] = {}
+        self._parallel_limit = asyncio.Semaphore(MAX_PARALLEL_DISPATCH)
+        self._schemas: tuple[ToolSchema, ...] | None = None
 
     def register(self, tool: Tool) -> None:
         self._tools[tool.name] = tool
+        self._schemas = None
 
     def register_all(self, tools: list[Tool]) -> None:
         for tool in tools:
@@ -27,10 +63,22 @@ class ToolDispatcher:
     def get_tool(self, name: str) -> Tool | None:
         return self._tools.get(name)
 
+    def is_parallel_safe(self, tool_name: str) -> bool:
+        tool = self._tools.get(tool_name)
+        return tool is not None and tool.parallel_safe
+
     async def dispatch(
-        self, tool_name: str, args: dict[str, Any], context: ToolContext
+        self,
+        tool_name: str,
+        args: dict[str, Any],
+        context: ToolContext,
+        cache: ReadCache | None = None,
     ) -> ToolResult:
-        """Dispatch a tool call with capability checking and event logging."""
+        """Dispatch a tool call with capability checking and event logging.
+
+        With a ``cache``, repeated parallel-safe calls return the earlier result
+        and any other call invalidates it.
+        """
         tool = self._tools.get(tool_name)
         if tool is None:
             return ToolResult.error(f"Unknown tool: {tool_name}")
@@ -47,6 +95,22 @@ class ToolDispatcher:
                 f"Capability '{tool.required_capability.value}' not granted for tool '{tool_name}'"
             )
 
+        key: tuple[str, str] | None = None
+        if cache is not None:
+            if tool.parallel_safe:
+                key = cache.key(tool_name, args)
+                cached = cache.get(key)
+                if cached is not None:
+                    context.event_log.emit(
+                        phase=context.deadline.current_phase.value,
+                        event_type=f"tool.{tool_name}.cached",
+                        summary=f"{tool_name} → cached",
+                        data={"tool": tool_name, "args": _sanitize_for_log(args, context)},
+                    )
+                    return cached
+            else:
+                cache.clear()
+
         # Log the call (with secrets redacted and bulky fields trimmed)
         context.event_log.emit(
             phase=context.deadline.current_phase.value,
@@ -55,8 +119,13 @@ class ToolDispatcher:
             data={"tool": tool_name, "args": _sanitize_for_log(args, context)},
         )
 
-        # Execute
-        result = await tool.execute(args, context)
+        # Execute; a raising tool (e.g. on malformed arguments) fails only this call
+        try:
+            result = await tool.execute(args, context)
+        except Exception as e:
+            result = ToolResult.error(f"{tool_name} failed: {type(e).__name__}: {e}")
+        if key is not None and cache is not None:
+            cache.put(key, result)
 
         # Log the result (with secrets redacted and bulky fields trimmed)
         context.event_log.emit(
@@ -72,6 +141,49 @@ class ToolDispatcher:
 
         return result
 
+    async def dispatch_batch(
+        self,
+        calls: list[tuple[str, dict[str, Any]]],
+        context: ToolContext,
+        cache: ReadCache | None = None,
+    ) -> list[ToolResult]:
+        """Dispatch one turn's tool calls, returning results in call order.
+
+        Consecutive parallel-safe calls run concurrently; any other call is a
+        barrier and runs alone, so writes and commands keep their ordering.
+        """
+        results: list[ToolResult] = []
+        i = 0
+        while i < len(calls):
+            j = i
+            while j < len(calls) and self.is_parallel_safe(calls[j][0]):
+                j += 1
+            if j == i:
+                name, args = calls[i]
+                results.append(await self.dispatch(name, args, context, cache))
+                i += 1
+                continue
+            results.extend(
+                await asyncio.gather(
+                    *(
+                        self._dispatch_limited(name, args, context, cache)
+                        for name, args in calls[i:j]
+                    )
+                )
+            )
+            i = j
+        return results
+
+    async def _dispatch_limited(
+        self,
+        tool_name: str,
+        args: dict[str, Any],
+        context: ToolContext,
+        cache: ReadCache | None = None,
+    ) -> ToolResult:
+        async with self._parallel_limit:
+            return await self.dispatch(tool_name, args, context, cache)
+
     def to_schemas(self) -> list[dict[str, Any]]:
         """Convert all registered tools to LLM function/tool schemas."""
         schemas = []
@@ -85,6 +197,15 @@ class ToolDispatcher:
             )
         return schemas
 
+    def tool_schemas(self) -> tuple[ToolSchema, ...]:
+        """Registered tools as LLM ToolSchemas, built once until the next register()."""
+        if self._schemas is None:
+            self._schemas = tuple(
+                ToolSchema(name=s["name"], description=s["description"], parameters=s["parameters"])
+                for s in self.to_schemas()
+            )
+        return self._schemas
+
 
 def _sanitize_for_log(payload: Any, context: ToolContext) -> Any:
     """Redact secrets and trim bulky fields before logging."""
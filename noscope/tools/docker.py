@@ -8,6 +8,7 @@ container with zero risk to the host.
 from __future__ import annotations
 
 import asyncio
+import contextlib
 from pathlib import Path
 from typing import Any
 
@@ -21,6 +22,31 @@ DOCKER_MEMORY_LIMIT = "1g"
 DOCKER_CPU_LIMIT = "2.0"
 
 
+async def pull_image(image: str = DOCKER_IMAGE) -> None:
+    """Make sure the sandbox image is available locally, pulling it if needed.
+
+    Safe to run before the workspace is settled; failures are left for
+    ``DockerSandbox.ensure_running`` to report. Cancelling it stops the docker
+    child process too.
+    """
+    if await _run_quiet("docker", "image", "inspect", image) == 0:
+        return
+    await _run_quiet("docker", "pull", "--quiet", image)
+
+
+async def _run_quiet(*cmd: str) -> int:
+    """Run a command with output discarded; terminate it if the caller is cancelled."""
+    proc = await asyncio.create_subprocess_exec(
+        *cmd, stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.DEVNULL
+    )
+    try:
+        return await proc.wait()
+    except asyncio.CancelledError:
+        with contextlib.suppress(ProcessLookupError):
+            proc.terminate()
+        raise
+
+
 class DockerSandbox:
     """Manages a fully isolated Docker container.
 
@@ -223,6 +249,7 @@ class DockerReadFileTool(Tool):
     name = "read_file"
     description = "Read the contents of a file within the workspace"
     required_capability = Capability.WORKSPACE_RW
+    parallel_safe = True
 
     def __init__(self, sandbox: DockerSandbox) -> None:
         self._docker = DockerFileTool(sandbox)
@@ -272,6 +299,7 @@ class DockerListDirectoryTool(Tool):
     name = "list_directory"
     description = "List contents of a directory within the workspace"
     required_capability = Capability.WORKSPACE_RW
+    parallel_safe = True
 
     def __init__(self, sandbox: DockerSandbox) -> None:
         self._docker = DockerFileTool(sandbox)
@@ -13,6 +13,7 @@ class ReadFileTool(Tool):
     name = "read_file"
     description = "Read the contents of a file within the workspace"
     required_capability = Capability.WORKSPACE_RW
+    parallel_safe = True
 
     def parameters_schema(self) -> dict[str, Any]:
         return {
@@ -64,6 +65,7 @@ class ListDirectoryTool(Tool):
     name = "list_directory"
     description = "List contents of a directory within the workspace"
     required_capability = Capability.WORKSPACE_RW
+    parallel_safe = True
 
     def parameters_schema(self) -> dict[str, Any]:
         return {
@@ -45,6 +45,7 @@ class GitStatusTool(Tool):
     name = "git_status"
     description = "Show the working tree status"
     required_capability = Capability.GIT
+    parallel_safe = True
 
     def parameters_schema(self) -> dict[str, Any]:
         return {"type": "object", "properties": {}}
@@ -109,6 +110,7 @@ class GitDiffTool(Tool):
     name = "git_diff"
     description = "Show changes in the working tree"
     required_capability = Capability.GIT
+    parallel_safe = True
 
     def parameters_schema(self) -> dict[str, Any]:
         return {"type": "object", "properties": {}}
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import re
+from collections.abc import Mapping
 from typing import Any
 
 # Keep assignment key names while redacting the value.
@@ -33,7 +34,7 @@ _PRIVATE_KEY_BLOCK = re.compile(
 )
 
 
-def redact(text: str, secrets: dict[str, str]) -> str:
+def redact(text: str, secrets: Mapping[str, str]) -> str:
     """Replace explicit secret values in text with [REDACTED:<name>]."""
     if not secrets:
         return text
@@ -62,12 +63,12 @@ def redact_env_vars(text: str) -> str:
     return _PRIVATE_KEY_BLOCK.sub("[REDACTED:auto]", result)
 
 
-def redact_text(text: str, secrets: dict[str, str]) -> str:
+def redact_text(text: str, secrets: Mapping[str, str]) -> str:
     """Apply explicit and automatic redaction to text."""
     return redact_env_vars(redact(text, secrets))
 
 
-def redact_structured(data: Any, secrets: dict[str, str]) -> Any:
+def redact_structured(data: Any, secrets: Mapping[str, str]) -> Any:
     """Recursively redact secrets from nested structures."""
     if isinstance(data, str):
         return redact_text(data, secrets)
@@ -79,6 +79,11 @@ class ShellTool(Tool):
                     "description": "Timeout in seconds",
                     "default": 60,
                 },
+                "max_output": {
+                    "type": "integer",
+                    "description": "Maximum characters of stdout and of stderr to return",
+                    "default": MAX_OUTPUT_LENGTH,
+                },
             },
             "required": ["command"],
         }
@@ -90,6 +95,13 @@ class ShellTool(Tool):
         remaining = context.deadline.remaining()
         dynamic_cap = max(30, int(remaining * 0.15))  # At least 30s, at most 15% of remaining
         timeout = min(args.get("timeout", 60), hard_cap, dynamic_cap)
+        max_output = args.get("max_output", MAX_OUTPUT_LENGTH)
+        # Model-supplied: a negative or non-integer value would mis-slice or raise
+        if not isinstance(max_output, int) or isinstance(max_output, bool) or max_output < 0:
+            return ToolResult.error(
+                f"max_output must be a non-negative integer, got {max_output!r}"
+            )
+        max_output = min(max_output, MAX_OUTPUT_LENGTH)
 
         # Safety check
         denial = check_command_safety(command, danger_mode=context.danger_mode)
@@ -125,11 +137,11 @@ class ShellTool(Tool):
         stderr = redact_text(stderr_bytes.decode("utf-8", errors="replace"), context.secrets)
         exit_code = proc.returncode or 0
 
-        # Truncate very long output
-        if len(stdout) > MAX_OUTPUT_LENGTH:
-            stdout = stdout[:MAX_OUTPUT_LENGTH] + "\n... (truncated)"
-        if len(stderr) > MAX_OUTPUT_LENGTH:
-            stderr = stderr[:MAX_OUTPUT_LENGTH] + "\n... (truncated)"
+        # Truncate very long output (after redaction, so no secret is split)
+        if len(stdout) > max_output:
+            stdout = stdout[:max_output] + "\n... (truncated)"
+        if len(stderr) > max_output:
+            stderr = stderr[:max_output] + "\n... (truncated)"
 
         display = stdout
         if stderr:
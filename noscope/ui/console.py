@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import threading
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
@@ -14,6 +18,37 @@ from noscope.capabilities import CapabilityRequest
 from noscope.deadline import Deadline, Phase
 
 
+async def ask_user(ask: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Run a blocking prompt such as ``Confirm.ask`` without blocking the event loop.
+
+    The prompt runs in a daemon thread rather than the default executor, which
+    ``asyncio.run`` joins on shutdown: after Ctrl+C the process exits at once
+    instead of waiting for ``input()`` to return.
+    """
+    loop = asyncio.get_running_loop()
+    answer: asyncio.Future[Any] = loop.create_future()
+
+    def settle(result: Any, error: BaseException | None) -> None:
+        if answer.done():  # cancelled while the user was typing
+            return
+        if error is not None:
+            answer.set_exception(error)
+        else:
+            answer.set_result(result)
+
+    def prompt() -> None:
+        try:
+            result, error = ask(*args, **kwargs), None
+        except BaseException as e:
+            result, error = None, e
+        # RuntimeError: the loop closed while waiting for input
+        with contextlib.suppress(RuntimeError):
+            loop.call_soon_threadsafe(settle, result, error)
+
+    threading.Thread(target=prompt, name="noscope-prompt", daemon=True).start()
+    return await answer
+
+
 class ConsoleUI:
     """Rich-powered console output for NoScope runs."""
 
@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import AsyncIterator
 from typing import Any
 
 import pytest
 
 from noscope.agents import AuditAgent, BuildAgent
-from noscope.deadline import Deadline
+from noscope.deadline import Deadline, Phase
 from noscope.llm.base import LLMResponse, Message, StreamChunk, ToolCall, ToolSchema, Usage
 from noscope.planning.models import PlanTask
 from noscope.supervisor import Supervisor
@@ -21,6 +22,7 @@ class FakeProvider:
     def __init__(self, responses: list[LLMResponse]) -> None:
         self._responses = responses
         self._idx = 0
+        self.last_messages: list[Message] = []
 
     async def complete(
         self,
@@ -29,6 +31,7 @@ class FakeProvider:
         model: str | None = None,
         json_schema: dict[str, Any] | None = None,
     ) -> LLMResponse:
+        self.last_messages = messages
         if self._idx < len(self._responses):
             resp = self._responses[self._idx]
             self._idx += 1
@@ -53,6 +56,20 @@ def _make_tasks() -> list[PlanTask]:
     ]
 
 
+class _SlowProvider(FakeProvider):
+    def __init__(self, delay: float) -> None:
+        super().__init__([])
+        self.calls = 0
+        self.finished = 0
+        self._delay = delay
+
+    async def complete(self, *args: Any, **kwargs: Any) -> LLMResponse:
+        self.calls += 1
+        await asyncio.sleep(self._delay)
+        self.finished += 1
+        return LLMResponse(content="still working", stop_reason="max_tokens")
+
+
 class TestBuildAgent:
     @pytest.mark.asyncio
     async def test_agent_marks_tasks_complete(self, tool_context: ToolContext) -> None:
@@ -90,6 +107,125 @@ class TestBuildAgent:
         assert result[0].completed is True
         event_log.close()
 
+    @pytest.mark.asyncio
+    async def test_tool_results_in_call_order(self, tool_context: ToolContext) -> None:
+        from noscope.tools.dispatcher import ToolDispatcher
+        from noscope.tools.filesystem import ReadFileTool, WriteFileTool
+
+        (tool_context.workspace / "a.txt").write_text("old")
+        dispatcher = ToolDispatcher()
+        dispatcher.register_all([ReadFileTool(), WriteFileTool()])
+        calls = [
+            ToolCall(id="c1", name="read_file", arguments={"path": "a.txt"}),
+            ToolCall(id="c2", name="mark_task_complete", arguments={"task_id": "t1"}),
+            ToolCall(id="c3", name="write_file", arguments={"path": "a.txt", "content": "new"}),
+            ToolCall(id="c4", name="read_file", arguments={"path": "a.txt"}),
+        ]
+        provider = FakeProvider([LLMResponse(tool_calls=calls, usage=Usage())])
+        agent = BuildAgent(
+            agent_id="test",
+            provider=provider,
+            dispatcher=dispatcher,
+            context=tool_context,
+            event_log=tool_context.event_log,
+            deadline=tool_context.deadline,
+        )
+        await agent.run([PlanTask(id="t1", title="Test", kind="edit")], "You are a builder.")
+
+        tool_messages = [m for m in provider.last_messages if m.role == "tool"]
+        assert [m.tool_call_id for m in tool_messages] == ["c1", "c2", "c3", "c4"]
+        # Same-path calls keep their order
+        assert "old" in tool_messages[0].content
+        assert "new" in tool_messages[3].content
+
+    @pytest.mark.asyncio
+    async def test_static_prefix_is_cached(self, tool_context: ToolContext) -> None:
+        from noscope.tools.dispatcher import ToolDispatcher
+
+        provider = FakeProvider([])
+        agent = BuildAgent(
+            agent_id="test",
+            provider=provider,
+            dispatcher=ToolDispatcher(),
+            context=tool_context,
+            event_log=tool_context.event_log,
+            deadline=tool_context.deadline,
+        )
+        await agent.run([PlanTask(id="t1", title="Test", kind="edit")], "You are a builder.")
+        system, task_list = provider.last_messages[:2]
+        assert system.cache and task_list.cache
+        assert "[t1] Test" in task_list.content
+
+    @pytest.mark.asyncio
+    async def test_context_follows_shared_prompt(self, tool_context: ToolContext) -> None:
+        from noscope.supervisor import WORKER_SYSTEM_PROMPT
+        from noscope.tools.dispatcher import ToolDispatcher
+
+        provider = FakeProvider([])
+        agent = BuildAgent(
+            agent_id="test",
+            provider=provider,
+            dispatcher=ToolDispatcher(),
+            context=tool_context,
+            event_log=tool_context.event_log,
+            deadline=tool_context.deadline,
+        )
+        tasks = [PlanTask(id="t1", title="Test", kind="edit")]
+        await agent.run(tasks, WORKER_SYSTEM_PROMPT, "You are worker agent 0.")
+        shared, context = provider.last_messages[:2]
+        assert shared.content == WORKER_SYSTEM_PROMPT and shared.cache
+        assert context.role == "system" and not context.cache
+
+    @pytest.mark.asyncio
+    async def test_model_turn_bounded_by_deadline(self, tool_context: ToolContext) -> None:
+        from noscope.tools.dispatcher import ToolDispatcher
+
+        provider = _SlowProvider(delay=60)
+        agent = BuildAgent(
+            agent_id="test",
+            provider=provider,
+            dispatcher=ToolDispatcher(),
+            context=tool_context,
+            event_log=tool_context.event_log,
+            deadline=Deadline(2),
+        )
+        await asyncio.wait_for(agent.run([], "You are a builder."), timeout=5)
+        assert provider.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_turn_finishes_past_phase_boundary(self, tool_context: ToolContext) -> None:
+        from noscope.tools.dispatcher import ToolDispatcher
+
+        # BUILD ends 1s in, but the timebox leaves room for the 1.5s turn to land
+        provider = _SlowProvider(delay=1.5)
+        agent = BuildAgent(
+            agent_id="test",
+            provider=provider,
+            dispatcher=ToolDispatcher(),
+            context=tool_context,
+            event_log=tool_context.event_log,
+            deadline=Deadline(4, allocation={Phase.BUILD: 0.25}),
+        )
+        await agent.run([], "You are a builder.")
+        assert provider.calls == provider.finished == 1
+
+    @pytest.mark.asyncio
+    async def test_skips_turn_that_cannot_finish(self, tool_context: ToolContext) -> None:
+        from noscope.tools.dispatcher import ToolDispatcher
+
+        # BUILD ends 2.8s in; turns end at 0.8s, 1.6s, 2.4s, leaving less than one turn
+        provider = _SlowProvider(delay=0.8)
+        agent = BuildAgent(
+            agent_id="test",
+            provider=provider,
+            dispatcher=ToolDispatcher(),
+            context=tool_context,
+            event_log=tool_context.event_log,
+            deadline=Deadline(4),
+        )
+        await agent.run([], "You are a builder.")
+        assert provider.calls == 3
+
     @pytest.mark.asyncio
     async def test_agent_stops_when_all_tasks_complete(self, tool_context: ToolContext) -> None:
         tasks = [PlanTask(id="t1", title="Test", kind="edit", completed=True)]
@@ -145,6 +281,62 @@ class TestSupervisor:
         all_ids = {t.id for stream in streams for t in stream}
         assert all_ids == {"t2", "t3", "t4"}
 
+    def test_partition_keeps_dependency_chains_together(self) -> None:
+        supervisor = Supervisor.__new__(Supervisor)
+        tasks = [
+            PlanTask(id="t4", title="Polish", kind="edit", depends_on=["t3"]),
+            PlanTask(id="t5", title="Docs", kind="edit", depends_on=["t1"]),
+            PlanTask(id="t3", title="Feature B", kind="edit", depends_on=["t2"]),
+            PlanTask(id="t2", title="Feature A", kind="edit", depends_on=["t1"]),
+            PlanTask(id="t6", title="Styles", kind="edit", depends_on=["t1"]),
+        ]
+        streams = supervisor._partition_tasks(tasks)
+        assert [[t.id for t in s] for s in streams] == [["t2", "t3", "t4"], ["t5", "t6"]]
+
+    def test_partition_diamond_is_one_stream(self) -> None:
+        supervisor = Supervisor.__new__(Supervisor)
+        tasks = [
+            PlanTask(id="t5", title="Join", kind="edit", depends_on=["t3", "t4"]),
+            PlanTask(id="t3", title="Left", kind="edit", depends_on=["t2"]),
+            PlanTask(id="t4", title="Right", kind="edit", depends_on=["t2"]),
+            PlanTask(id="t2", title="Base", kind="edit", depends_on=["t1"]),
+        ]
+        (stream,) = supervisor._partition_tasks(tasks)
+        ids = [t.id for t in stream]
+        assert ids[0] == "t2" and ids[-1] == "t5"
+
+    def test_partition_runs_mvp_before_stretch(self) -> None:
+        supervisor = Supervisor.__new__(Supervisor)
+        tasks = [
+            PlanTask(id="t2", title="Animations", kind="edit", priority="stretch"),
+            PlanTask(id="t3", title="API", kind="edit"),
+            PlanTask(id="t4", title="UI", kind="edit"),
+            PlanTask(id="t5", title="Themes", kind="edit", priority="stretch"),
+            PlanTask(id="t6", title="Theme picker", kind="edit", depends_on=["t5"]),
+        ]
+        streams = supervisor._partition_tasks(tasks)
+        # t5 is stretch, but the MVP t6 needs it, so it goes ahead of t2
+        assert [[t.id for t in s] for s in streams] == [["t5", "t6", "t2"], ["t3", "t4"]]
+
+    def test_partition_cycle_keeps_every_task(self) -> None:
+        supervisor = Supervisor.__new__(Supervisor)
+        tasks = [
+            PlanTask(id="t2", title="A", kind="edit", depends_on=["t3"]),
+            PlanTask(id="t3", title="B", kind="edit", depends_on=["t2"]),
+            PlanTask(id="t4", title="C", kind="edit"),
+        ]
+        streams = supervisor._partition_tasks(tasks)
+        assert sorted(t.id for s in streams for t in s) == ["t2", "t3", "t4"]
+
+    def test_partition_rejects_duplicate_ids(self) -> None:
+        supervisor = Supervisor.__new__(Supervisor)
+        tasks = [
+            PlanTask(id="t2", title="A", kind="edit"),
+            PlanTask(id="t2", title="B", kind="edit"),
+        ]
+        with pytest.raises(ValueError, match="Duplicate task ids: t2"):
+            supervisor._partition_tasks(tasks)
+
     def test_partition_empty(self) -> None:
         supervisor = Supervisor.__new__(Supervisor)
         assert supervisor._partition_tasks([]) == []
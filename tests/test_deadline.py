@@ -61,3 +61,14 @@ class TestDeadline:
         d = Deadline(300)
         time.sleep(0.01)
         assert d.elapsed() > 0
+
+    def test_phase_over(self) -> None:
+        d = Deadline(3600, allocation={Phase.PLAN: 0.0, Phase.BUILD: 1.0})
+        assert d.phase_over(Phase.PLAN) is True
+        assert d.phase_over(Phase.BUILD) is False
+        assert Deadline(0).phase_over(Phase.BUILD) is True
+
+    def test_phase_share(self) -> None:
+        d = Deadline(600)
+        assert d.phase_share(Phase.HANDOFF) == 30.0
+        assert Deadline(600, allocation={Phase.BUILD: 1.0}).phase_share(Phase.HANDOFF) == 0.0
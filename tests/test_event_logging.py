@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import os
 from pathlib import Path
@@ -84,6 +85,35 @@ class TestEventLog:
         assert "sk-abcdefghijklmnopqrstuvwxyz123456" not in raw
         assert "[REDACTED:auto]" in raw
 
+    async def test_flush_interval_buffers_until_flush(self, tmp_path: Path) -> None:
+        rd = RunDir(base=tmp_path / "runs")
+        log = EventLog(rd, flush_interval=60)
+        log.emit("BUILD", "e1", "First")
+        log.emit("BUILD", "e2", "Second")
+        assert rd.events_path.read_text() == ""
+
+        log.flush()
+        assert len(rd.events_path.read_text().splitlines()) == 2
+        log.emit("BUILD", "e3", "Third")
+        log.close()
+        assert len(rd.events_path.read_text().splitlines()) == 3
+
+    async def test_buffered_tail_flushed_by_timer(self, tmp_path: Path) -> None:
+        rd = RunDir(base=tmp_path / "runs")
+        log = EventLog(rd, flush_interval=0.05)
+        log.emit("BUILD", "e1", "Last event before a long model call")
+        assert rd.events_path.read_text() == ""
+        await asyncio.sleep(0.1)
+        assert len(rd.events_path.read_text().splitlines()) == 1
+        log.close()
+
+    def test_flush_interval_without_event_loop_flushes(self, tmp_path: Path) -> None:
+        rd = RunDir(base=tmp_path / "runs")
+        log = EventLog(rd, flush_interval=60)
+        log.emit("BUILD", "e1", "First")
+        assert len(rd.events_path.read_text().splitlines()) == 1
+        log.close()
+
     def test_event_log_permissions_owner_only(self, tmp_path: Path) -> None:
         rd = RunDir(base=tmp_path / "runs")
         log = EventLog(rd)
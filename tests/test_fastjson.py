@@ -0,0 +1,39 @@
+"""Tests for the hot-path JSON encoder."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from noscope import fastjson
+
+
+class TestDumps:
+    def test_compact_and_unicode(self) -> None:
+        assert fastjson.dumps({"a": [1, 2], "b": "é"}) == '{"a":[1,2],"b":"é"}'
+
+    def test_same_output_without_orjson(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        payload = {"stdout": "ok\n", "exit_code": 0, "nested": {"x": None}}
+        expected = fastjson.dumps(payload)
+        monkeypatch.setattr(fastjson, "HAS_ORJSON", False)
+        assert fastjson.dumps(payload) == expected
+        assert json.loads(expected) == payload
+
+    def test_floats_equivalent_without_orjson(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        payload = {"big": 1e16, "small": 0.1, "neg": -2.5e-7}
+        fast = fastjson.dumps(payload)
+        monkeypatch.setattr(fastjson, "HAS_ORJSON", False)
+        assert json.loads(fastjson.dumps(payload)) == json.loads(fast) == payload
+
+    def test_non_string_keys_fall_back(self) -> None:
+        assert fastjson.dumps({1: "a"}) == '{"1":"a"}'
+
+
+class TestDumpsIndented:
+    def test_matches_stdlib_layout(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        payload = {"tasks": [{"id": "t1", "done": False}], "empty": [], "name": "é"}
+        expected = json.dumps(payload, ensure_ascii=False, indent=2).encode()
+        assert fastjson.dumps_indented(payload) == expected
+        monkeypatch.setattr(fastjson, "HAS_ORJSON", False)
+        assert fastjson.dumps_indented(payload) == expected
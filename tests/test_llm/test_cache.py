@@ -0,0 +1,98 @@
+"""Tests for the disk-backed LLM response cache."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from pathlib import Path
+from typing import Any
+
+from noscope.llm.base import LLMResponse, Message, StreamChunk, ToolSchema, Usage
+from noscope.llm.cache import CachedProvider
+
+
+class CountingProvider:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def complete(
+        self,
+        messages: list[Message],
+        tools: list[ToolSchema] | None = None,
+        model: str | None = None,
+        json_schema: dict[str, Any] | None = None,
+    ) -> LLMResponse:
+        self.calls += 1
+        return LLMResponse(
+            content=f"report {self.calls}",
+            usage=Usage(input_tokens=10, output_tokens=5),
+            stop_reason="end_turn",
+        )
+
+    async def stream(
+        self,
+        messages: list[Message],
+        tools: list[ToolSchema] | None = None,
+        model: str | None = None,
+    ) -> AsyncIterator[StreamChunk]:
+        yield StreamChunk(is_final=True)
+
+
+class TestCachedProvider:
+    async def test_identical_call_served_from_disk(self, tmp_path: Path) -> None:
+        inner = CountingProvider()
+        cached = CachedProvider(inner, namespace="test:model", cache_dir=tmp_path)
+        messages = [Message(role="user", content="write the report")]
+
+        first = await cached.complete(messages)
+        second = await CachedProvider(inner, "test:model", cache_dir=tmp_path).complete(messages)
+
+        assert inner.calls == 1
+        assert second.content == first.content == "report 1"
+        assert second.stop_reason == "end_turn"
+        assert second.usage.input_tokens == 0
+
+    async def test_key_covers_prompt_and_namespace(self, tmp_path: Path) -> None:
+        inner = CountingProvider()
+        messages = [Message(role="user", content="a")]
+        await CachedProvider(inner, "test:model", cache_dir=tmp_path).complete(messages)
+        await CachedProvider(inner, "test:other", cache_dir=tmp_path).complete(messages)
+        await CachedProvider(inner, "test:model", cache_dir=tmp_path).complete(
+            [Message(role="user", content="b")]
+        )
+        assert inner.calls == 3
+
+    async def test_corrupt_entry_is_a_miss(self, tmp_path: Path) -> None:
+        inner = CountingProvider()
+        cached = CachedProvider(inner, "test:model", cache_dir=tmp_path)
+        messages = [Message(role="user", content="a")]
+        (tmp_path / f"{cached.cache_key(messages)}.json").write_text("{not json")
+        response = await cached.complete(messages)
+        assert response.content == "report 1"
+
+    async def test_expired_entry_is_a_miss(self, tmp_path: Path) -> None:
+        inner = CountingProvider()
+        messages = [Message(role="user", content="a")]
+        await CachedProvider(inner, "test:model", cache_dir=tmp_path).complete(messages)
+        response = await CachedProvider(inner, "test:model", cache_dir=tmp_path, ttl=0).complete(
+            messages
+        )
+        assert inner.calls == 2
+        assert response.content == "report 2"
+
+    async def test_invalid_or_truncated_response_not_written(self, tmp_path: Path) -> None:
+        inner = CountingProvider()
+        messages = [Message(role="user", content="a")]
+        rejecting = CachedProvider(
+            inner, "test:model", cache_dir=tmp_path, validate=lambda r: False
+        )
+        await rejecting.complete(messages)
+        assert list(tmp_path.iterdir()) == []
+
+        class TruncatingProvider(CountingProvider):
+            async def complete(self, *args: Any, **kwargs: Any) -> LLMResponse:
+                return LLMResponse(content="{", stop_reason="max_tokens")
+
+        await CachedProvider(TruncatingProvider(), "test:model", cache_dir=tmp_path).complete(
+            messages
+        )
+        assert list(tmp_path.iterdir()) == []
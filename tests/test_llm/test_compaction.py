@@ -0,0 +1,35 @@
+"""Tests for conversation history compaction."""
+
+from __future__ import annotations
+
+from noscope.llm.base import Message
+from noscope.llm.compaction import elide_old_tool_results
+
+
+def _turns(n: int, output: str) -> list[Message]:
+    messages = [Message(role="system", content="s"), Message(role="user", content="go")]
+    for i in range(n):
+        messages.append(Message(role="assistant", content=f"turn {i}"))
+        messages.append(Message(role="tool", content=output, tool_call_id=str(i)))
+    return messages
+
+
+class TestElideOldToolResults:
+    def test_nothing_to_do_within_window(self) -> None:
+        messages = _turns(3, "x" * 2000)
+        assert elide_old_tool_results(messages, keep_turns=3) == 0
+
+    def test_old_large_results_elided(self) -> None:
+        messages = _turns(4, "Error: boom\n" + "x" * 2000)
+        assert elide_old_tool_results(messages, keep_turns=3) == 1
+        assert messages[3].content.startswith("[elided 2012 chars; first line: Error: boom]")
+        assert messages[5].content.startswith("Error: boom\nxxx")
+
+    def test_small_results_kept(self) -> None:
+        messages = _turns(6, "ok")
+        assert elide_old_tool_results(messages, keep_turns=2) == 0
+
+    def test_idempotent(self) -> None:
+        messages = _turns(5, "x" * 2000)
+        assert elide_old_tool_results(messages, keep_turns=2) == 3
+        assert elide_old_tool_results(messages, keep_turns=2) == 0
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from typing import Any
+
 from noscope.llm.base import LLMResponse, Message, ToolCall, ToolSchema, Usage
 
 
@@ -51,3 +53,67 @@ class TestToolSchema:
             parameters={"type": "object", "properties": {"path": {"type": "string"}}},
         )
         assert s.name == "read_file"
+
+
+class TestAnthropicCacheControl:
+    def test_plain_system_stays_string(self) -> None:
+        from noscope.llm.providers.anthropic import _split_messages
+
+        system, api_messages = _split_messages(
+            [Message(role="system", content="rules"), Message(role="user", content="hi")]
+        )
+        assert system == "rules"
+        assert api_messages == [{"role": "user", "content": "hi"}]
+
+    def test_cached_system_becomes_blocks(self) -> None:
+        from noscope.llm.providers.anthropic import _split_messages
+
+        system, _ = _split_messages(
+            [
+                Message(role="system", content="static", cache=True),
+                Message(role="system", content="dynamic"),
+            ]
+        )
+        assert isinstance(system, list)
+        assert system[0]["cache_control"] == {"type": "ephemeral"}
+        assert "cache_control" not in system[1]
+
+    def test_breakpoints_capped(self) -> None:
+        from noscope.llm.providers.anthropic import MAX_CACHE_BREAKPOINTS, _split_messages
+
+        messages = [Message(role="system", content="s", cache=True)]
+        messages += [Message(role="user", content=f"u{i}", cache=True) for i in range(6)]
+        system, api_messages = _split_messages(messages)
+        blocks = list(system)
+        blocks += [m["content"][-1] for m in api_messages if isinstance(m["content"], list)]
+        assert sum("cache_control" in b for b in blocks) == MAX_CACHE_BREAKPOINTS
+
+    def test_newest_breakpoint_rolls_forward(self) -> None:
+        from noscope.llm.providers.anthropic import _split_messages
+
+        messages = [Message(role="system", content="s", cache=True)]
+        messages += [Message(role="user", content=f"u{i}", cache=True) for i in range(6)]
+        _, api_messages = _split_messages(messages)
+        assert "cache_control" in api_messages[-1]["content"][-1]
+        assert isinstance(api_messages[-2]["content"], str)
+
+
+class TestToolPayloadCache:
+    def test_reuses_payload_for_same_schemas(self) -> None:
+        from noscope.llm.base import ToolPayloadCache
+
+        calls: list[int] = []
+
+        def convert(tools: list[ToolSchema]) -> list[dict[str, Any]]:
+            calls.append(len(tools))
+            return [{"name": t.name} for t in tools]
+
+        schemas = [ToolSchema(name="a", description="", parameters={})]
+        cache = ToolPayloadCache(convert)
+        first = cache.get(schemas)
+        assert cache.get(list(schemas)) is first
+        assert calls == [1]
+
+        other = [ToolSchema(name="a", description="", parameters={})]
+        assert cache.get(other) == first
+        assert calls == [1, 1]
@@ -0,0 +1,72 @@
+"""Tests for streamed completion assembly."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from typing import Any
+
+from noscope.llm.base import LLMResponse, Message, StreamChunk, ToolCall, ToolSchema, Usage
+from noscope.llm.streaming import EarlyToolCalls, complete_turn, stream_complete
+
+
+class StreamingProvider:
+    """Streams two text deltas, three tool calls, then a final usage chunk."""
+
+    streams_tool_calls = True
+
+    def __init__(self) -> None:
+        self.started_before_end: list[str] = []
+        self.early: EarlyToolCalls | None = None
+
+    async def complete(
+        self,
+        messages: list[Message],
+        tools: list[ToolSchema] | None = None,
+        model: str | None = None,
+        json_schema: dict[str, Any] | None = None,
+    ) -> LLMResponse:
+        raise AssertionError("complete() should not be used")
+
+    async def stream(
+        self,
+        messages: list[Message],
+        tools: list[ToolSchema] | None = None,
+        model: str | None = None,
+    ) -> AsyncIterator[StreamChunk]:
+        yield StreamChunk(delta_text="Reading ")
+        yield StreamChunk(delta_text="files")
+        yield StreamChunk(delta_tool_call=ToolCall(id="1", name="read_file", arguments={}))
+        yield StreamChunk(delta_tool_call=ToolCall(id="2", name="write_file", arguments={}))
+        yield StreamChunk(delta_tool_call=ToolCall(id="3", name="read_file", arguments={}))
+        await asyncio.sleep(0)
+        if self.early:
+            self.started_before_end = list(self.early.tasks)
+        yield StreamChunk(
+            is_final=True, usage=Usage(input_tokens=7, output_tokens=3), stop_reason="tool_use"
+        )
+
+
+class TestStreamComplete:
+    async def test_assembles_response(self) -> None:
+        seen: list[str] = []
+        response = await stream_complete(
+            StreamingProvider(), [], on_tool_call=lambda tc: seen.append(tc.id)
+        )
+        assert response.content == "Reading files"
+        assert [tc.id for tc in response.tool_calls] == ["1", "2", "3"]
+        assert response.usage.input_tokens == 7
+        assert response.stop_reason == "tool_use"
+        assert seen == ["1", "2", "3"]
+
+    async def test_only_leading_safe_calls_start_early(self) -> None:
+        provider = StreamingProvider()
+
+        async def run(tc: ToolCall) -> str:
+            return tc.id
+
+        early = EarlyToolCalls(lambda name: name == "read_file", run)
+        provider.early = early
+        await complete_turn(provider, [], early=early)
+        assert provider.started_before_end == ["1"]
+        assert await early.tasks["1"] == "1"
@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+from pathlib import Path
+
+import pytest
+
 from noscope.planning.models import AcceptancePlan, PlanOutput, PlanTask
 from noscope.spec.models import AcceptanceCheck, SpecInput
 
@@ -38,3 +42,107 @@ class TestSpecInput:
         )
         assert spec.acceptance[0].is_cmd is True
         assert spec.acceptance[1].is_cmd is False
+
+
+class TestLocalTools:
+    def test_tools_built_once(self) -> None:
+        from noscope.orchestrator import _local_tools
+
+        first = _local_tools()
+        assert first is _local_tools()
+        assert len({t.name for t in first}) == len(first)
+
+
+class TestSummarize:
+    def test_counts(self) -> None:
+        from noscope.orchestrator import _summarize
+
+        tasks = [
+            PlanTask(id="t1", title="a", kind="edit", completed=True),
+            PlanTask(id="t2", title="b", kind="edit"),
+        ]
+        stats = _summarize(tasks, [{"name": "c1", "passed": True}, {"name": "c2"}])
+        assert (stats.tasks_completed, stats.tasks_total) == (1, 2)
+        assert (stats.checks_passed, stats.checks_total) == (1, 2)
+
+
+class TestClearWorkspace:
+    def test_keeps_metadata_dirs(self, tmp_path: Path) -> None:
+        import threading
+
+        from noscope.orchestrator import _clear_workspace
+
+        ws = tmp_path / "ws"
+        (ws / ".git").mkdir(parents=True)
+        (ws / ".noscope").mkdir()
+        (ws / "node_modules" / "pkg").mkdir(parents=True)
+        (ws / "node_modules" / "pkg" / "index.js").write_text("x")
+        (ws / "app.py").write_text("print(1)")
+
+        _clear_workspace(ws)
+
+        assert sorted(p.name for p in ws.iterdir()) == [".git", ".noscope"]
+        for t in threading.enumerate():
+            if t.name == "noscope-clear-workspace":
+                t.join()
+        assert not any(p.name.startswith(".noscope-trash-") for p in tmp_path.iterdir())
+
+    def test_sweeps_stale_trash(self, tmp_path: Path, caplog: pytest.LogCaptureFixture) -> None:
+        import threading
+
+        from noscope.orchestrator import _clear_workspace
+
+        # Left by a run killed before its background delete finished
+        stale = tmp_path / ".noscope-trash-0123"
+        (stale / "node_modules").mkdir(parents=True)
+        ws = tmp_path / "ws"
+        ws.mkdir()
+        (ws / "app.py").write_text("print(1)")
+
+        _clear_workspace(ws)
+        for t in threading.enumerate():
+            if t.name == "noscope-clear-workspace":
+                t.join()
+
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["ws"]
+        assert "Could not fully delete" not in caplog.text
+
+    def test_failed_trash_delete_is_logged(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        import shutil
+
+        from noscope.orchestrator import _delete_trash
+
+        trash = tmp_path / ".noscope-trash-0123"
+        trash.mkdir()
+        monkeypatch.setattr(shutil, "rmtree", lambda *a, **kw: None)
+        _delete_trash([trash])
+        assert "Could not fully delete" in caplog.text
+
+
+class TestDetectLaunch:
+    async def test_fastapi_app(self, tmp_path: Path) -> None:
+        from noscope.orchestrator import _detect_launch
+
+        (tmp_path / "app.py").write_text("from fastapi import FastAPI\napp = FastAPI()\n")
+        (tmp_path / "package.json").write_text("{}")
+        cmd, url = await _detect_launch(tmp_path)
+        assert cmd is not None and "uvicorn" in cmd
+        assert url == "http://localhost:8000"
+
+    async def test_marker_at_end_of_large_file(self, tmp_path: Path) -> None:
+        from noscope.orchestrator import _detect_launch
+
+        padding = "".join(f"def handler_{i}():\n    return {i}\n\n" for i in range(2000))
+        (tmp_path / "main.py").write_text(
+            f"{padding}if __name__ == '__main__':\n    import uvicorn\n"
+            "    from fastapi import FastAPI\n    uvicorn.run(FastAPI())\n"
+        )
+        assert (tmp_path / "main.py").stat().st_size > 32768
+        assert await _detect_launch(tmp_path) == ("python3 main.py", "http://localhost:5000")
+
+    async def test_nothing_to_launch(self, tmp_path: Path) -> None:
+        from noscope.orchestrator import _detect_launch
+
+        assert await _detect_launch(tmp_path) == (None, "")
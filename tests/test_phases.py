@@ -2,15 +2,30 @@
 
 from __future__ import annotations
 
+import asyncio
 from pathlib import Path
+from typing import Any
 
 import pytest
 
-from noscope.deadline import Deadline
+from noscope.deadline import Deadline, Phase
+from noscope.llm.base import LLMResponse
 from noscope.logging.events import EventLog, RunDir
-from noscope.phases import HandoffPhase, RequestPhase
-from noscope.planning.models import PlanOutput, PlanTask
+from noscope.phases import HandoffPhase, HardenPhase, RequestPhase, VerifyPhase
+from noscope.planning.models import AcceptancePlan, PlanOutput, PlanTask
 from noscope.spec.models import SpecInput
+from noscope.tools.base import ToolContext, ToolResult
+from noscope.tools.dispatcher import ToolDispatcher
+from noscope.tools.shell import ShellTool
+
+
+class _RecordingShell(ShellTool):
+    def __init__(self) -> None:
+        self.timeouts: list[int] = []
+
+    async def execute(self, args: dict[str, Any], context: ToolContext) -> ToolResult:
+        self.timeouts.append(args["timeout"])
+        return await super().execute(args, context)
 
 
 @pytest.mark.asyncio
@@ -36,6 +51,57 @@ class TestRequestPhase:
         assert all(g.approved for g in grants)
         event_log.close()
 
+    async def test_prompt_answers(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        import io
+
+        from rich.console import Console
+
+        from noscope.capabilities import CapabilityRequest
+
+        answers = iter([True, False])
+        monkeypatch.setattr("noscope.phases.Confirm.ask", lambda *a, **kw: next(answers))
+        plan = PlanOutput(
+            requested_capabilities=[
+                CapabilityRequest(cap="workspace_rw", why="Write files", risk="low"),
+                CapabilityRequest(cap="net_http", why="Fetch data", risk="high"),
+            ]
+        )
+        event_log = EventLog(RunDir(base=tmp_path / "runs"))
+
+        phase = RequestPhase(console=Console(file=io.StringIO()))
+        grants = await phase.run(plan, event_log, Deadline(300))
+        event_log.close()
+
+        assert [(g.cap, g.approved) for g in grants] == [
+            ("workspace_rw", True),
+            ("net_http", False),
+        ]
+
+    async def test_cancelled_prompt_returns_promptly(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        import io
+        import threading
+
+        from rich.console import Console
+
+        from noscope.capabilities import CapabilityRequest
+
+        stdin = threading.Event()  # the user never answers
+        monkeypatch.setattr("noscope.phases.Confirm.ask", lambda *a, **kw: stdin.wait())
+        phase = RequestPhase(console=Console(file=io.StringIO()))
+        prompt = asyncio.create_task(
+            phase._prompt_user(CapabilityRequest(cap="net_http", why="Fetch", risk="high"))
+        )
+        try:
+            await asyncio.sleep(0.05)
+            prompt.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await asyncio.wait_for(prompt, timeout=1)
+            # What asyncio.run does on Ctrl+C; it must not wait on the pending input
+            loop = asyncio.get_running_loop()
+            await asyncio.wait_for(loop.shutdown_default_executor(), timeout=1)
+        finally:
+            stdin.set()
+
 
 @pytest.mark.asyncio
 class TestHandoffPhase:
@@ -56,3 +122,233 @@ class TestHandoffPhase:
         assert "Test" in report
         assert "Build it" in report
         event_log.close()
+
+    async def test_expired_deadline_skips_llm(self, tmp_path: Path) -> None:
+        class NoCallProvider:
+            async def complete(self, *args: Any, **kwargs: Any) -> None:
+                raise AssertionError("LLM must not be called after the deadline")
+
+        spec = SpecInput(name="Late", timebox="5m")
+        plan = PlanOutput(tasks=[PlanTask(id="t1", title="Build it", kind="edit")])
+
+        rd = RunDir(base=tmp_path / "runs")
+        event_log = EventLog(rd)
+        output = tmp_path / "HANDOFF.md"
+
+        report = await HandoffPhase().run(
+            spec,
+            plan,
+            plan.tasks,
+            [],
+            NoCallProvider(),  # type: ignore[arg-type]
+            event_log,
+            Deadline(0),
+            output,
+        )
+        event_log.close()
+
+        assert "# Handoff Report: Late" in report
+        assert output.read_text(encoding="utf-8") == report
+        events = rd.events_path.read_text(encoding="utf-8")
+        assert "handoff.fallback" in events
+
+    async def test_slow_llm_falls_back_at_deadline(self, tmp_path: Path) -> None:
+        class HangingProvider:
+            async def complete(self, *args: Any, **kwargs: Any) -> LLMResponse:
+                await asyncio.sleep(60)
+                return LLMResponse(content="late report")
+
+        spec = SpecInput(name="Slow", timebox="5m")
+        rd = RunDir(base=tmp_path / "runs")
+        event_log = EventLog(rd)
+
+        report = await HandoffPhase().run(
+            spec,
+            PlanOutput(),
+            [],
+            [],
+            HangingProvider(),  # type: ignore[arg-type]
+            event_log,
+            Deadline(1),
+            tmp_path / "HANDOFF.md",
+        )
+        event_log.close()
+
+        assert "# Handoff Report: Slow" in report
+        assert "handoff.fallback" in rd.events_path.read_text(encoding="utf-8")
+
+
+class TestListWorkspace:
+    def test_matches_full_sort_and_prunes(self, tmp_path: Path) -> None:
+        from noscope.phases import _list_workspace
+
+        for rel in ["a.txt", "a/b.py", "a/c/d.py", "a-b.txt", "z.md", "src/app.py"]:
+            (tmp_path / rel).parent.mkdir(parents=True, exist_ok=True)
+            (tmp_path / rel).write_text("x")
+        (tmp_path / "node_modules" / "pkg").mkdir(parents=True)
+        (tmp_path / "node_modules" / "pkg" / "index.js").write_text("x")
+        (tmp_path / ".git").mkdir()
+        (tmp_path / ".git" / "HEAD").write_text("x")
+
+        expected = sorted(
+            p.relative_to(tmp_path).as_posix()
+            for p in tmp_path.rglob("*")
+            if p.is_file() and not {".git", "node_modules"} & set(p.parts)
+        )
+        root = frozenset({"a", "a-b.txt", "z.md", "src", "node_modules", ".git", "a.txt"})
+        assert _list_workspace(tmp_path, 50) == (expected, False, root)
+        assert _list_workspace(tmp_path, 3) == (expected[:3], True, root)
+
+
+class _ReplyProvider:
+    def __init__(self, content: str) -> None:
+        self._content = content
+
+    async def complete(self, *args: Any, **kwargs: Any) -> LLMResponse:
+        return LLMResponse(content=self._content, stop_reason="end_turn")
+
+
+@pytest.mark.asyncio
+class TestVerifyPhase:
+    @pytest.mark.parametrize(
+        ("reply", "expected"),
+        [
+            ("Server is up.\nverified: responds on :5000", (True, "responds on :5000")),
+            ("FAILED: port 5000 in use", (False, "port 5000 in use")),
+            ("FAILED: port in use\nRetried on 5001.\nVERIFIED: up", (True, "up")),
+        ],
+    )
+    async def test_verdict(
+        self, tool_context: ToolContext, reply: str, expected: tuple[bool, str]
+    ) -> None:
+        result = await VerifyPhase().run(
+            SpecInput(name="App", timebox="5m"),
+            _ReplyProvider(reply),  # type: ignore[arg-type]
+            ToolDispatcher(),
+            tool_context,
+            tool_context.event_log,
+            tool_context.deadline,
+        )
+        assert result == expected
+
+    async def test_model_call_bounded_by_phase_budget(self, tool_context: ToolContext) -> None:
+        class HangingProvider:
+            async def complete(self, *args: Any, **kwargs: Any) -> LLMResponse:
+                await asyncio.sleep(60)
+                return LLMResponse()
+
+        # VERIFY's slot ends 1s in; the rest of the timebox is left for HANDOFF
+        deadline = Deadline(10, allocation={Phase.VERIFY: 0.1, Phase.HANDOFF: 0.9})
+        result = await VerifyPhase().run(
+            SpecInput(name="App", timebox="5m"),
+            HangingProvider(),  # type: ignore[arg-type]
+            ToolDispatcher(),
+            tool_context,
+            tool_context.event_log,
+            deadline,
+        )
+        assert result == (False, "Deadline expired during verification")
+        assert deadline.remaining() > 5
+
+    async def test_runs_after_slot_overrun(self, tool_context: ToolContext) -> None:
+        # VERIFY's slot is already over when it starts, but the timebox isn't
+        deadline = Deadline(100, allocation={Phase.HANDOFF: 0.1})
+        assert deadline.phase_remaining(Phase.VERIFY) == 0.0
+        result = await VerifyPhase().run(
+            SpecInput(name="App", timebox="5m"),
+            _ReplyProvider("VERIFIED: up on :5000"),  # type: ignore[arg-type]
+            ToolDispatcher(),
+            tool_context,
+            tool_context.event_log,
+            deadline,
+        )
+        assert result == (True, "up on :5000")
+
+    async def test_skipped_when_only_handoff_time_left(self, tool_context: ToolContext) -> None:
+        result = await VerifyPhase().run(
+            SpecInput(name="App", timebox="5m"),
+            _ReplyProvider("VERIFIED: up"),  # type: ignore[arg-type]
+            ToolDispatcher(),
+            tool_context,
+            tool_context.event_log,
+            Deadline(10, allocation={Phase.HANDOFF: 1.0}),
+        )
+        assert result == (False, "Skipped: no time left to verify before HANDOFF")
+
+
+@pytest.mark.asyncio
+class TestHardenPhase:
+    async def test_parallel_checks_keep_order(self, tool_context: ToolContext) -> None:
+        plan = PlanOutput(
+            acceptance_plan=[
+                AcceptancePlan(name="slow", cmd="sleep 0.2 && echo slow", independent=True),
+                AcceptancePlan(name="broken", cmd="exit 3", independent=True),
+                AcceptancePlan(name="fast", cmd="echo fast", independent=True),
+            ]
+        )
+        dispatcher = ToolDispatcher()
+        dispatcher.register(ShellTool())
+
+        results = await HardenPhase().run(
+            plan,
+            SpecInput(name="App", timebox="5m"),
+            dispatcher,
+            tool_context,
+            tool_context.event_log,
+            tool_context.deadline,
+        )
+
+        assert [r["name"] for r in results] == ["slow", "broken", "fast"]
+        assert [r["passed"] for r in results] == [True, False, True]
+
+    async def test_checks_run_serially_by_default(self, tool_context: ToolContext) -> None:
+        # The second check only passes once the first has finished
+        plan = PlanOutput(
+            acceptance_plan=[
+                AcceptancePlan(name="install", cmd="sleep 0.2 && touch installed"),
+                AcceptancePlan(name="import", cmd="test -f installed"),
+            ]
+        )
+        dispatcher = ToolDispatcher()
+        dispatcher.register(ShellTool())
+
+        results = await HardenPhase().run(
+            plan,
+            SpecInput(name="App", timebox="5m"),
+            dispatcher,
+            tool_context,
+            tool_context.event_log,
+            tool_context.deadline,
+        )
+
+        assert [r["passed"] for r in results] == [True, True]
+
+    async def _run_single_check(
+        self, tool_context: ToolContext, deadline: Deadline
+    ) -> tuple[list[dict[str, Any]], _RecordingShell]:
+        shell = _RecordingShell()
+        dispatcher = ToolDispatcher()
+        dispatcher.register(shell)
+        results = await HardenPhase().run(
+            PlanOutput(acceptance_plan=[AcceptancePlan(name="ok", cmd="true")]),
+            SpecInput(name="App", timebox="5m"),
+            dispatcher,
+            tool_context,
+            tool_context.event_log,
+            deadline,
+        )
+        return results, shell
+
+    async def test_timeout_clamped_to_remaining(self, tool_context: ToolContext) -> None:
+        results, shell = await self._run_single_check(
+            tool_context, Deadline(10, allocation={Phase.HARDEN: 1.0})
+        )
+        assert results[0]["passed"] is True
+        assert shell.timeouts and shell.timeouts[0] <= 10
+
+    async def test_skipped_when_almost_out_of_time(self, tool_context: ToolContext) -> None:
+        results, shell = await self._run_single_check(
+            tool_context, Deadline(1, allocation={Phase.HARDEN: 1.0})
+        )
+        assert results[0]["skipped"] is True
+        assert shell.timeouts == []
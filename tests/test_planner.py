@@ -11,7 +11,7 @@ import pytest
 from noscope.llm.base import LLMResponse, Message, StreamChunk, ToolSchema, Usage
 from noscope.phases import TokenTracker
 from noscope.planning.models import PlanOutput
-from noscope.planning.planner import plan
+from noscope.planning.planner import is_valid_plan, plan
 from noscope.spec.models import AcceptanceCheck, SpecInput
 
 
@@ -63,6 +63,7 @@ class FakeProvider:
     def __init__(self, responses: list[str]) -> None:
         self._responses = responses
         self._call_count = 0
+        self.last_messages: list[Message] = []
 
     async def complete(
         self,
@@ -71,6 +72,7 @@ class FakeProvider:
         model: str | None = None,
         json_schema: dict[str, Any] | None = None,
     ) -> LLMResponse:
+        self.last_messages = list(messages)
         idx = min(self._call_count, len(self._responses) - 1)
         self._call_count += 1
         return LLMResponse(
@@ -112,6 +114,31 @@ class TestPlanner:
         assert isinstance(result, PlanOutput)
         assert provider._call_count == 2
 
+    @pytest.mark.asyncio
+    async def test_retry_reuses_cached_prefix(self) -> None:
+        provider = FakeProvider(["not json", _valid_plan_json()])
+        await plan(_make_spec(), provider)
+        system, spec, *retry = provider.last_messages
+        assert system.cache and spec.cache
+        assert [m.role for m in retry] == ["assistant", "user"]
+
+    @pytest.mark.asyncio
+    async def test_retry_names_invalid_fields(self) -> None:
+        provider = FakeProvider(['{"tasks": [{"id": "t1", "kind": "edit"}]}', _valid_plan_json()])
+        await plan(_make_spec(), provider)
+        repair = provider.last_messages[-1].content
+        assert "tasks.0.title: Field required" in repair
+        assert "pydantic" not in repair
+
+    @pytest.mark.asyncio
+    async def test_retry_on_duplicate_task_ids(self) -> None:
+        duplicated = json.loads(_valid_plan_json())
+        duplicated["tasks"].append(dict(duplicated["tasks"][0], title="Again"))
+        provider = FakeProvider([json.dumps(duplicated), _valid_plan_json()])
+        result = await plan(_make_spec(), provider)
+        assert len(result.tasks) == 2
+        assert "Duplicate task id: t1" in provider.last_messages[-1].content
+
     @pytest.mark.asyncio
     async def test_plan_fails_after_retries(self) -> None:
         provider = FakeProvider(["bad", "still bad", "nope"])
@@ -125,3 +152,14 @@ class TestPlanner:
         await plan(_make_spec(), provider, tokens=tracker)
         assert tracker.input_tokens == 100
         assert tracker.output_tokens == 50
+
+    @pytest.mark.asyncio
+    async def test_serialized_fields_are_stable(self) -> None:
+        result = await plan(_make_spec(), FakeProvider([_valid_plan_json()]))
+        assert json.loads(result.mvp_definition_json) == result.mvp_definition
+        assert result.mvp_definition_json is result.mvp_definition_json
+        assert "mvp_definition_json" not in result.model_dump()
+
+    def test_is_valid_plan(self) -> None:
+        assert is_valid_plan(LLMResponse(content=f"```json\n{_valid_plan_json()}\n```"))
+        assert not is_valid_plan(LLMResponse(content='{"tasks": [{"id": "t1"'))
@@ -26,6 +26,10 @@ class TestParseDuration:
     def test_bare_number_is_minutes(self) -> None:
         assert _parse_duration("5") == 300
 
+    def test_trailing_bare_number_is_minutes(self) -> None:
+        assert _parse_duration("1h30") == 5400
+        assert _parse_duration("30s2m") == 150
+
     def test_invalid_raises(self) -> None:
         with pytest.raises(ValueError):
             _parse_duration("abc")
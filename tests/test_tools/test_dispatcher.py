@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 from typing import Any
 
@@ -9,7 +10,7 @@ import pytest
 
 from noscope.capabilities import Capability, CapabilityStore
 from noscope.tools.base import Tool, ToolContext, ToolResult
-from noscope.tools.dispatcher import ToolDispatcher
+from noscope.tools.dispatcher import ReadCache, ToolDispatcher
 
 
 class FakeTool(Tool):
@@ -42,6 +43,31 @@ class _DummyTool(Tool):
         )
 
 
+class _SlowReadTool(Tool):
+    """Parallel-safe tool that records how many calls overlap."""
+
+    name = "slow_read"
+    description = "Slow read for batch dispatch tests"
+    required_capability = Capability.WORKSPACE_RW
+    parallel_safe = True
+
+    def __init__(self) -> None:
+        self.active = 0
+        self.peak = 0
+        self.calls = 0
+
+    def parameters_schema(self) -> dict[str, Any]:
+        return {"type": "object", "properties": {"msg": {"type": "string"}}}
+
+    async def execute(self, args: dict[str, Any], context: ToolContext) -> ToolResult:
+        self.calls += 1
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        return ToolResult.ok(display=args.get("msg", ""))
+
+
 class TestToolDispatcher:
     def test_register_and_get(self) -> None:
         dispatcher = ToolDispatcher()
@@ -66,6 +92,15 @@ class TestToolDispatcher:
         assert schemas[0]["name"] == "fake_tool"
         assert schemas[0]["description"] == "A fake tool for testing"
 
+    def test_tool_schemas_cached_until_register(self) -> None:
+        dispatcher = ToolDispatcher()
+        dispatcher.register(FakeTool())
+        first = dispatcher.tool_schemas()
+        assert dispatcher.tool_schemas() is first
+        assert first[0].name == "fake_tool"
+        dispatcher.register(_DummyTool())
+        assert [s.name for s in dispatcher.tool_schemas()] == ["fake_tool", "dummy_tool"]
+
     @pytest.mark.asyncio
     async def test_dispatch_unknown_tool(self, tool_context: ToolContext) -> None:
         dispatcher = ToolDispatcher()
@@ -81,6 +116,16 @@ class TestToolDispatcher:
         assert result.status == "ok"
         assert "hello" in result.display
 
+    @pytest.mark.asyncio
+    async def test_dispatch_tool_exception(self, tool_context: ToolContext) -> None:
+        from noscope.tools.shell import ShellTool
+
+        dispatcher = ToolDispatcher()
+        dispatcher.register(ShellTool())
+        result = await dispatcher.dispatch("exec_command", {}, tool_context)
+        assert result.status == "error"
+        assert "KeyError" in result.display
+
     @pytest.mark.asyncio
     async def test_dispatch_capability_denied(self, tool_context: ToolContext) -> None:
         tool_context.capabilities = CapabilityStore()
@@ -119,6 +164,46 @@ class TestToolDispatcher:
         content = events_path.read_text()
         assert "denied" in content.lower()
 
+    @pytest.mark.asyncio
+    async def test_dispatch_batch_preserves_order(self, tool_context: ToolContext) -> None:
+        dispatcher = ToolDispatcher()
+        slow = _SlowReadTool()
+        dispatcher.register_all([slow, FakeTool()])
+        calls = [
+            ("slow_read", {"msg": "a"}),
+            ("slow_read", {"msg": "b"}),
+            ("fake_tool", {"msg": "c"}),
+            ("slow_read", {"msg": "d"}),
+        ]
+        results = await dispatcher.dispatch_batch(calls, tool_context)
+        assert [r.display for r in results] == ["a", "b", "got: c", "d"]
+        assert slow.peak == 2
+
+    @pytest.mark.asyncio
+    async def test_dispatch_batch_serializes_unsafe_tools(self, tool_context: ToolContext) -> None:
+        dispatcher = ToolDispatcher()
+        dispatcher.register(FakeTool())
+        assert not dispatcher.is_parallel_safe("fake_tool")
+        assert not dispatcher.is_parallel_safe("nonexistent")
+        results = await dispatcher.dispatch_batch([("fake_tool", {"msg": "x"})], tool_context)
+        assert results[0].display == "got: x"
+
+    @pytest.mark.asyncio
+    async def test_read_cache_until_unsafe_call(self, tool_context: ToolContext) -> None:
+        dispatcher = ToolDispatcher()
+        slow = _SlowReadTool()
+        dispatcher.register_all([slow, FakeTool()])
+        cache = ReadCache()
+
+        await dispatcher.dispatch("slow_read", {"msg": "a"}, tool_context, cache)
+        await dispatcher.dispatch("slow_read", {"msg": "a"}, tool_context, cache)
+        assert slow.calls == 1
+
+        await dispatcher.dispatch("fake_tool", {"msg": "w"}, tool_context, cache)
+        assert len(cache) == 0
+        await dispatcher.dispatch("slow_read", {"msg": "a"}, tool_context, cache)
+        assert slow.calls == 2
+
 
 @pytest.mark.asyncio
 async def test_dispatcher_redacts_and_omits_bulky_fields(tool_context: ToolContext) -> None:
@@ -146,3 +231,10 @@ async def test_dispatcher_redacts_and_omits_bulky_fields(tool_context: ToolConte
     raw = events_path.read_text(encoding="utf-8")
     assert "supersecret123" not in raw
     assert "sk-abcdefghijklmnopqrstuvwxyz123456" not in raw
+
+
+def test_tool_result_as_text() -> None:
+    assert ToolResult.ok(display="done", x=1).as_text == "done"
+    result = ToolResult.ok(stdout="hi", exit_code=0)
+    assert result.as_text == '{"stdout":"hi","exit_code":0}'
+    assert result.as_text is result.as_text
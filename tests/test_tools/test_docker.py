@@ -0,0 +1,33 @@
+"""Tests for Docker sandbox helpers."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from noscope.tools import docker
+
+
+@pytest.mark.asyncio
+async def test_cancelled_pull_stops_child(monkeypatch: pytest.MonkeyPatch) -> None:
+    started: list[asyncio.subprocess.Process] = []
+    real_exec = asyncio.create_subprocess_exec
+
+    async def fake_exec(*cmd: str, **kwargs: Any) -> asyncio.subprocess.Process:
+        # Stand-ins for `docker image inspect` (missing image) and `docker pull`
+        argv = ("false",) if "inspect" in cmd else ("sleep", "30")
+        proc = await real_exec(*argv, **kwargs)
+        started.append(proc)
+        return proc
+
+    monkeypatch.setattr(docker.asyncio, "create_subprocess_exec", fake_exec)
+    pull = asyncio.create_task(docker.pull_image())
+    while len(started) < 2:
+        await asyncio.sleep(0.01)
+
+    pull.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await pull
+    assert await asyncio.wait_for(started[1].wait(), timeout=2) != 0
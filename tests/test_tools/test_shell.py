@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from typing import Any
+
 import pytest
 
 from noscope.tools.base import ToolContext
@@ -51,6 +53,21 @@ class TestShellTool:
         assert result.status == "error"
         assert "outside workspace" in result.display.lower()
 
+    async def test_max_output(self, tool_context: ToolContext) -> None:
+        tool = ShellTool()
+        result = await tool.execute(
+            {"command": "printf 'x%.0s' $(seq 100)", "max_output": 10}, tool_context
+        )
+        assert result.data["stdout"] == "x" * 10 + "\n... (truncated)"
+
+    @pytest.mark.parametrize("max_output", [-5, "10", 2.5, True])
+    async def test_invalid_max_output(self, tool_context: ToolContext, max_output: Any) -> None:
+        result = await ShellTool().execute(
+            {"command": "echo hi", "max_output": max_output}, tool_context
+        )
+        assert result.status == "error"
+        assert "max_output" in result.display
+
     async def test_secret_redaction(self, tool_context: ToolContext) -> None:
         tool_context.secrets = {"MY_SECRET": "supersecret123"}
         tool = ShellTool()